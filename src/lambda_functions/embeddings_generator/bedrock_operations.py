@@ -1,38 +1,99 @@
 """AWS Bedrock operations for generating embeddings."""
 
-import json
-from typing import List
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
 import boto3
+import orjson
 from botocore.exceptions import ClientError
 
-from .constants import DEFAULT_EMBEDDING_MODEL_ID
+from .constants import (
+    BOTO_CLIENT_CONFIG,
+    COHERE_INPUT_TYPE,
+    COHERE_MAX_BATCH_TEXTS,
+    COHERE_MODEL_PREFIX,
+    DEFAULT_EMBEDDING_MODEL_ID,
+    EMBEDDING_JITTER_SECONDS,
+    EMBEDDING_MAX_WORKERS,
+)
+
+_BEDROCK_RUNTIME = boto3.client("bedrock-runtime", config=BOTO_CLIENT_CONFIG)
+_TITAN_BODY_PREFIX = b'{"inputText":'
+_TITAN_BODY_SUFFIX = b"}"
 
 
 class BedrockClient:
     """Handle embedding generation using AWS Bedrock."""
 
-    def __init__(self, model_id: str = DEFAULT_EMBEDDING_MODEL_ID) -> None:
-        """Initialize Bedrock runtime client."""
-        self.bedrock_runtime = boto3.client("bedrock-runtime")
+    def __init__(
+        self,
+        model_id: str = DEFAULT_EMBEDDING_MODEL_ID,
+        max_workers: int = EMBEDDING_MAX_WORKERS,
+    ) -> None:
+        """Initialize Bedrock runtime client.
+
+        Keep max_workers at or below BOTO_MAX_POOL_CONNECTIONS so every
+        worker gets its own pooled connection.
+        """
+        self.bedrock_runtime = _BEDROCK_RUNTIME
         self.model_id = model_id
+        self.max_workers = max_workers
 
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for given text."""
         try:
-            body = json.dumps({"inputText": text})
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.model_id, body=body
-            )
-
-            response_body = json.loads(response["body"].read())
-            return response_body["embedding"]
+            body = _TITAN_BODY_PREFIX + orjson.dumps(text) + _TITAN_BODY_SUFFIX
+            response = self._invoke(body)
+            return orjson.loads(response["body"].read())["embedding"]
         except ClientError as e:
             raise Exception(f"Bedrock embedding generation failed: {str(e)}")
 
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
-        return [self.generate_embedding(text) for text in texts]
+        """Generate embeddings for multiple texts concurrently, preserving order."""
+        if not self.model_id.startswith(COHERE_MODEL_PREFIX):
+            return self._map_concurrently(self.generate_embedding, texts)
+
+        batches = [
+            texts[start : start + COHERE_MAX_BATCH_TEXTS]
+            for start in range(0, len(texts), COHERE_MAX_BATCH_TEXTS)
+        ]
+        results = self._map_concurrently(self._generate_cohere_batch, batches)
+        return [embedding for batch in results for embedding in batch]
 
     def set_model(self, model_id: str) -> None:
         """Change the embedding model."""
         self.model_id = model_id
+
+    def _generate_cohere_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed up to COHERE_MAX_BATCH_TEXTS texts in a single request."""
+        try:
+            body = orjson.dumps({"texts": texts, "input_type": COHERE_INPUT_TYPE})
+            response = self._invoke(body)
+            return orjson.loads(response["body"].read())["embeddings"]
+        except ClientError as e:
+            raise Exception(f"Bedrock embedding generation failed: {str(e)}")
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: List[Any]
+    ) -> List[Any]:
+        """Apply func to items on the worker pool and return results in order."""
+        results: List[Optional[Any]] = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._run_jittered, func, item): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    @staticmethod
+    def _run_jittered(func: Callable[[Any], Any], item: Any) -> Any:
+        """Delay briefly before invoking so workers do not burst together."""
+        time.sleep(random.uniform(0, EMBEDDING_JITTER_SECONDS))
+        return func(item)
+
+    def _invoke(self, body: bytes) -> Dict[str, Any]:
+        """Invoke the model; throttling is retried by the client's adaptive mode."""
+        return self.bedrock_runtime.invoke_model(modelId=self.model_id, body=body)
@@ -0,0 +1,3 @@
+import os
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-2")
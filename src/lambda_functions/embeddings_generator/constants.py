@@ -1,12 +1,45 @@
 """Configuration constants for embeddings generator Lambda."""
 
+from botocore.config import Config
+
 # Bedrock Model Configuration
 DEFAULT_EMBEDDING_MODEL_ID = "amazon.titan-embed-text-v2:0"
 EMBEDDING_DIMENSION = 1024
 MAX_INPUT_TOKENS = 8192
+EMBEDDING_MAX_WORKERS = 16
+COHERE_MODEL_PREFIX = "cohere.embed"
+COHERE_MAX_BATCH_TEXTS = 96
+COHERE_INPUT_TYPE = "search_document"
+EMBEDDING_JITTER_SECONDS = 0.05
+
+# Boto3 Client Configuration
+# One pooled connection per embedding worker, otherwise threads queue on the pool
+BOTO_MAX_POOL_CONNECTIONS = EMBEDDING_MAX_WORKERS
+BOTO_MAX_RETRY_ATTEMPTS = 8
+BOTO_RETRY_MODE = "adaptive"
+BOTO_TCP_KEEPALIVE = True
+# Shared by module-level clients that worker threads use concurrently. Low-level
+# clients are thread-safe; boto3 resources are not and must not be shared.
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=BOTO_MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": BOTO_MAX_RETRY_ATTEMPTS, "mode": BOTO_RETRY_MODE},
+    tcp_keepalive=BOTO_TCP_KEEPALIVE,
+)
 
 # S3 Configuration
 EMBEDDINGS_OUTPUT_FOLDER = "embeddings"
+EMBEDDINGS_METADATA_SUFFIX = "_embeddings.json.gz"
+EMBEDDINGS_VECTORS_SUFFIX = "_embeddings.npz"
+EMBEDDINGS_QUANTIZATION = "uint8_minmax"
+QUANTIZATION_MAX_CODE = 255
+MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 8
+GZIP_COMPRESSION_LEVEL = 6
+GZIP_CONTENT_TYPE = "application/gzip"
+NPZ_CONTENT_TYPE = "application/octet-stream"
+EMBEDDINGS_CACHE_FOLDER = "embeddings_cache"
+EMBEDDINGS_CACHE_EXTENSION = ".f32"
+S3_MISSING_KEY_ERROR_CODES = {"NoSuchKey", "404"}
 BATCH_SIZE = 25
 
 # File Processing
@@ -16,7 +49,9 @@ CHUNK_SIZE = 1024
 CHUNK_OVERLAP = 50
 
 # Textract Configuration
-TEXTRACT_MAX_PAGES = 1000
+TEXTRACT_POLL_INITIAL_SECONDS = 1
+TEXTRACT_POLL_MAX_SECONDS = 10
 
 # Lambda Configuration
 PROCESSING_TIMEOUT_BUFFER = 5
+WARMUP_EVENT_KEY = "warmup"
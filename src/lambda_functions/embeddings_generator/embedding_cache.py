@@ -0,0 +1,69 @@
+"""Content-addressed cache of chunk embeddings stored in S3."""
+
+import hashlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from .constants import (
+    EMBEDDING_MAX_WORKERS,
+    EMBEDDINGS_CACHE_EXTENSION,
+    EMBEDDINGS_CACHE_FOLDER,
+)
+from .s3_operations import S3Client
+
+
+class EmbeddingCache:
+    """Store embeddings as raw float32 bytes keyed by model and chunk SHA-256."""
+
+    def __init__(
+        self, s3_client: S3Client, max_workers: int = EMBEDDING_MAX_WORKERS
+    ) -> None:
+        """Initialize cache on top of an S3 client."""
+        self.s3_client = s3_client
+        self.max_workers = max_workers
+
+    def get_many(
+        self, bucket: str, model_id: str, texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        """Return cached embeddings in input order, None for misses."""
+        keys = [self._cache_key(model_id, text) for text in texts]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda key: self._get(bucket, key), keys))
+
+    def put_many(
+        self,
+        bucket: str,
+        model_id: str,
+        texts: List[str],
+        embeddings: List[List[float]],
+    ) -> None:
+        """Store embeddings for the given texts."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.s3_client.write_file,
+                    bucket,
+                    self._cache_key(model_id, text),
+                    array("f", embedding).tobytes(),
+                )
+                for text, embedding in zip(texts, embeddings)
+            ]
+            for future in futures:
+                future.result()
+
+    def _get(self, bucket: str, key: str) -> Optional[List[float]]:
+        """Fetch and decode a single cached embedding; a missing key is a miss."""
+        content = self.s3_client.read_file_if_exists(bucket, key)
+        if content is None:
+            return None
+        embedding = array("f")
+        embedding.frombytes(content)
+        return embedding.tolist()
+
+    @staticmethod
+    def _cache_key(model_id: str, text: str) -> str:
+        """Build the S3 key for a chunk embedded with a given model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        prefix = f"{EMBEDDINGS_CACHE_FOLDER}/{model_id}"
+        return f"{prefix}/{digest}{EMBEDDINGS_CACHE_EXTENSION}"
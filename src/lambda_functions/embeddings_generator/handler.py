@@ -1,11 +1,14 @@
 """Lambda handler for embeddings generation."""
 
-import json
 import traceback
 from typing import Any, Dict
 
+import orjson
+
 from .processor import EmbeddingProcessor
-from .constants import DEFAULT_EMBEDDING_MODEL_ID
+from .constants import DEFAULT_EMBEDDING_MODEL_ID, WARMUP_EVENT_KEY
+
+_PROCESSOR_CACHE: Dict[str, EmbeddingProcessor] = {}
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -18,26 +21,32 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "key": "path/to/file.pdf",
         "model_id": "amazon.titan-embed-text-v2:0"  # Optional
     }
+
+    A scheduled {"warmup": true} event only builds the default processor.
     """
+    if event.get(WARMUP_EVENT_KEY):
+        _get_processor(DEFAULT_EMBEDDING_MODEL_ID)
+        return {"statusCode": 200, "body": orjson.dumps({"message": "warm"}).decode()}
+
     try:
         bucket = event["bucket"]
         key = event["key"]
         model_id = event.get("model_id", DEFAULT_EMBEDDING_MODEL_ID)
 
-        processor = EmbeddingProcessor(model_id)
+        processor = _get_processor(model_id)
         embedding_doc = processor.process_file(bucket, key)
         output_key = processor.save_embeddings(bucket, key, embedding_doc)
 
         return {
             "statusCode": 200,
-            "body": json.dumps(
+            "body": orjson.dumps(
                 {
                     "message": "Embeddings generated successfully",
                     "source_file": key,
                     "output_file": output_key,
                     "chunk_count": embedding_doc["chunk_count"],
                 }
-            ),
+            ).decode(),
         }
 
     except Exception as e:
@@ -46,5 +55,12 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": error_message}),
+            "body": orjson.dumps({"error": error_message}).decode(),
         }
+
+
+def _get_processor(model_id: str) -> EmbeddingProcessor:
+    """Return the processor for model_id, reusing it across warm invocations."""
+    if model_id not in _PROCESSOR_CACHE:
+        _PROCESSOR_CACHE[model_id] = EmbeddingProcessor(model_id)
+    return _PROCESSOR_CACHE[model_id]
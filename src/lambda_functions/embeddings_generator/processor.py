@@ -3,14 +3,21 @@
 import os
 from typing import Any, Dict, List
 
+import numpy as np
+
 from .constants import (
+    EMBEDDINGS_METADATA_SUFFIX,
     EMBEDDINGS_OUTPUT_FOLDER,
+    EMBEDDINGS_QUANTIZATION,
+    EMBEDDINGS_VECTORS_SUFFIX,
     PDF_EXTENSION,
     SUPPORTED_TEXT_EXTENSIONS,
 )
 from .s3_operations import S3Client
 from .textract_operations import TextractClient
 from .bedrock_operations import BedrockClient
+from .embedding_cache import EmbeddingCache
+from .quantization import quantize_uint8
 from .text_chunker import TextChunker
 
 
@@ -23,6 +30,7 @@ class EmbeddingProcessor:
         self.textract_client = TextractClient()
         self.bedrock_client = BedrockClient(model_id) if model_id else BedrockClient()
         self.text_chunker = TextChunker()
+        self.embedding_cache = EmbeddingCache(self.s3_client)
 
     def process_file(self, bucket: str, key: str) -> Dict[str, Any]:
         """Process a single file and generate embeddings."""
@@ -37,13 +45,35 @@ class EmbeddingProcessor:
             raise ValueError(f"Unsupported file type: {file_extension}")
 
         chunks = self.text_chunker.chunk_text(text)
-        embeddings = self._generate_chunk_embeddings(chunks)
+        embeddings = self._generate_chunk_embeddings(bucket, chunks)
 
         return self._create_embedding_document(key, chunks, embeddings)
 
-    def _generate_chunk_embeddings(self, chunks: List[str]) -> List[List[float]]:
-        """Generate embeddings for all chunks."""
-        return self.bedrock_client.generate_embeddings_batch(chunks)
+    def _generate_chunk_embeddings(
+        self, bucket: str, chunks: List[str]
+    ) -> List[List[float]]:
+        """Generate embeddings for all chunks, embedding each distinct text once."""
+        unique_chunks = list(dict.fromkeys(chunks))
+        unique_embeddings = self._embed_unique_chunks(bucket, unique_chunks)
+        embeddings_by_text = dict(zip(unique_chunks, unique_embeddings))
+        return [embeddings_by_text[chunk] for chunk in chunks]
+
+    def _embed_unique_chunks(
+        self, bucket: str, chunks: List[str]
+    ) -> List[List[float]]:
+        """Embed distinct chunks, reusing cached vectors."""
+        model_id = self.bedrock_client.model_id
+        embeddings = self.embedding_cache.get_many(bucket, model_id, chunks)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not misses:
+            return embeddings
+
+        texts = [chunks[i] for i in misses]
+        generated = self.bedrock_client.generate_embeddings_batch(texts)
+        self.embedding_cache.put_many(bucket, model_id, texts, generated)
+        for index, embedding in zip(misses, generated):
+            embeddings[index] = embedding
+        return embeddings
 
     def _create_embedding_document(
         self, source_key: str, chunks: List[str], embeddings: List[List[float]]
@@ -53,18 +83,28 @@ class EmbeddingProcessor:
             "source_file": source_key,
             "model": self.bedrock_client.model_id,
             "chunk_count": len(chunks),
-            "embeddings": [
-                {"chunk_index": i, "text": chunks[i], "embedding": embeddings[i]}
-                for i in range(len(chunks))
+            "chunks": [
+                {"chunk_index": i, "text": chunk} for i, chunk in enumerate(chunks)
             ],
+            "embeddings": np.asarray(embeddings, dtype=np.float32),
         }
 
     def save_embeddings(
         self, bucket: str, source_key: str, embedding_doc: Dict[str, Any]
     ) -> str:
-        """Save embeddings to S3."""
+        """Save chunk metadata as JSON and uint8-quantized vectors as .npz."""
         file_name = os.path.splitext(os.path.basename(source_key))[0]
-        output_key = f"{EMBEDDINGS_OUTPUT_FOLDER}/{file_name}_embeddings.json"
+        output_prefix = f"{EMBEDDINGS_OUTPUT_FOLDER}/{file_name}"
+        output_key = f"{output_prefix}{EMBEDDINGS_METADATA_SUFFIX}"
+        vectors_key = f"{output_prefix}{EMBEDDINGS_VECTORS_SUFFIX}"
+
+        codes, scale, offset = quantize_uint8(embedding_doc["embeddings"])
+        self.s3_client.write_arrays(
+            bucket, vectors_key, codes=codes, scale=scale, offset=offset
+        )
 
-        self.s3_client.write_embeddings(bucket, output_key, embedding_doc)
+        metadata = {k: v for k, v in embedding_doc.items() if k != "embeddings"}
+        metadata["embeddings_file"] = vectors_key
+        metadata["quantization"] = EMBEDDINGS_QUANTIZATION
+        self.s3_client.write_embeddings(bucket, output_key, metadata)
         return output_key
@@ -0,0 +1,29 @@
+"""Scalar quantization of embedding vectors for compact storage."""
+
+from typing import Tuple
+
+import numpy as np
+
+from .constants import QUANTIZATION_MAX_CODE
+
+
+def quantize_uint8(
+    vectors: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Quantize float vectors to uint8 codes with per-dimension scale and offset."""
+    if not vectors.size:
+        empty = np.zeros(vectors.shape[1:], dtype=np.float32)
+        return vectors.astype(np.uint8), empty, empty
+
+    offset = vectors.min(axis=0)
+    scale = (vectors.max(axis=0) - offset) / QUANTIZATION_MAX_CODE
+    scale[scale == 0] = 1.0
+    codes = np.round((vectors - offset) / scale).astype(np.uint8)
+    return codes, scale.astype(np.float32), offset.astype(np.float32)
+
+
+def dequantize_uint8(
+    codes: np.ndarray, scale: np.ndarray, offset: np.ndarray
+) -> np.ndarray:
+    """Reconstruct approximate float32 vectors from uint8 codes."""
+    return codes.astype(np.float32) * scale + offset
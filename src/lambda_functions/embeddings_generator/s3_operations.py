@@ -1,17 +1,39 @@
 """S3 operations for reading and writing files."""
 
-import json
-from typing import Any, Dict
+import gzip
+import io
+from typing import Any, Dict, Optional
 import boto3
+import numpy as np
+import orjson
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
+from .constants import (
+    BOTO_CLIENT_CONFIG,
+    GZIP_COMPRESSION_LEVEL,
+    GZIP_CONTENT_TYPE,
+    MULTIPART_MAX_CONCURRENCY,
+    MULTIPART_THRESHOLD_BYTES,
+    NPZ_CONTENT_TYPE,
+    S3_MISSING_KEY_ERROR_CODES,
+)
+
+_S3 = boto3.client("s3", config=BOTO_CLIENT_CONFIG)
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+    max_concurrency=MULTIPART_MAX_CONCURRENCY,
+    use_threads=True,
+)
+
 
 class S3Client:
     """Handle S3 read and write operations."""
 
     def __init__(self) -> None:
         """Initialize S3 client."""
-        self.s3_client = boto3.client("s3")
+        self.s3_client = _S3
 
     def read_file(self, bucket: str, key: str) -> bytes:
         """Read file content from S3."""
@@ -21,16 +43,51 @@ class S3Client:
         except ClientError as e:
             raise Exception(f"Failed to read s3://{bucket}/{key}: {str(e)}")
 
+    def read_file_if_exists(self, bucket: str, key: str) -> Optional[bytes]:
+        """Read file content from S3, returning None if the key is missing."""
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+            return response["Body"].read()
+        except ClientError as e:
+            if e.response["Error"]["Code"] in S3_MISSING_KEY_ERROR_CODES:
+                return None
+            raise Exception(f"Failed to read s3://{bucket}/{key}: {str(e)}")
+
+    def write_file(self, bucket: str, key: str, content: bytes) -> None:
+        """Write raw bytes to S3."""
+        try:
+            self.s3_client.put_object(Bucket=bucket, Key=key, Body=content)
+        except ClientError as e:
+            raise Exception(f"Failed to write s3://{bucket}/{key}: {str(e)}")
+
     def write_embeddings(
         self, bucket: str, key: str, embeddings: Dict[str, Any]
     ) -> None:
-        """Write embeddings to S3 as JSON."""
+        """Write embeddings to S3 as gzip-compressed compact JSON."""
+        content = orjson.dumps(embeddings, option=orjson.OPT_SERIALIZE_NUMPY)
+        compressed = gzip.compress(content, compresslevel=GZIP_COMPRESSION_LEVEL)
+        self._upload(bucket, key, io.BytesIO(compressed), GZIP_CONTENT_TYPE)
+
+    def write_arrays(self, bucket: str, key: str, **arrays: np.ndarray) -> None:
+        """Write named numpy arrays to S3 in .npz format."""
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        self._upload(bucket, key, buffer, NPZ_CONTENT_TYPE)
+
+    def _upload(
+        self, bucket: str, key: str, buffer: io.BytesIO, content_type: str
+    ) -> None:
+        """Upload a buffer from its start, using multipart for large payloads."""
+        buffer.seek(0)
         try:
-            content = json.dumps(embeddings, indent=2)
-            self.s3_client.put_object(
-                Bucket=bucket, Key=key, Body=content.encode("utf-8")
+            self.s3_client.upload_fileobj(
+                buffer,
+                Bucket=bucket,
+                Key=key,
+                Config=_TRANSFER_CONFIG,
+                ExtraArgs={"ContentType": content_type},
             )
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             raise Exception(f"Failed to write s3://{bucket}/{key}: {str(e)}")
 
     def check_file_exists(self, bucket: str, key: str) -> bool:
@@ -1,9 +1,35 @@
 """Unit tests for embeddings generator Lambda."""
 
-from . import handler
+from . import (
+    bedrock_operations,
+    embedding_cache,
+    handler,
+    processor,
+    quantization,
+    s3_operations,
+    text_chunker,
+    textract_operations,
+)
+import gzip
+import io
 import json
+from array import array
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
+from botocore.exceptions import ClientError
+
+
+@pytest.fixture(autouse=True)
+def _clear_processor_cache() -> None:
+    handler._PROCESSOR_CACHE.clear()
+
+
+def _bedrock_response(embedding: list) -> dict:
+    return {"body": io.BytesIO(json.dumps({"embedding": embedding}).encode())}
+
+
 @patch.object(handler, 'EmbeddingProcessor')
 def test_lambda_handler_success(mock_processor_class) -> None:
     """Test successful embedding generation."""
@@ -66,3 +92,211 @@ def test_lambda_handler_with_custom_model(mock_processor_class) -> None:
 #         assert response["statusCode"] == 500
 #         body = json.loads(response["body"])
 #         assert "error" in body
+
+
+@patch.object(handler, 'EmbeddingProcessor')
+def test_lambda_handler_reuses_processor_across_invocations(mock_processor_class) -> None:
+    """Warm invocations with the same model reuse the cached processor."""
+    mock_instance = MagicMock()
+    mock_processor_class.return_value = mock_instance
+    mock_instance.process_file.return_value = {"chunk_count": 1}
+    event = {"bucket": "test-bucket", "key": "documents/test.txt"}
+
+    handler.lambda_handler(event, None)
+    handler.lambda_handler(event, None)
+
+    mock_processor_class.assert_called_once()
+    assert mock_instance.process_file.call_count == 2
+
+
+@patch.object(handler, 'EmbeddingProcessor')
+def test_lambda_handler_warmup_short_circuits(mock_processor_class) -> None:
+    """Warm-up pings build the default processor without processing files."""
+    response = handler.lambda_handler({"warmup": True}, None)
+
+    assert response["statusCode"] == 200
+    mock_processor_class.assert_called_once_with("amazon.titan-embed-text-v2:0")
+    mock_processor_class.return_value.process_file.assert_not_called()
+
+
+@patch.object(bedrock_operations, '_BEDROCK_RUNTIME')
+def test_generate_embeddings_batch_preserves_order(mock_runtime) -> None:
+    """Concurrent batch returns embeddings in input order."""
+    mock_runtime.invoke_model.side_effect = lambda modelId, body: _bedrock_response(
+        [float(len(json.loads(body)["inputText"]))]
+    )
+    client = bedrock_operations.BedrockClient()
+
+    result = client.generate_embeddings_batch(["a", "bbb", "cc", "dddd"])
+
+    assert result == [[1.0], [3.0], [2.0], [4.0]]
+
+
+@patch.object(bedrock_operations, '_BEDROCK_RUNTIME')
+def test_generate_embedding_leaves_throttling_retries_to_botocore(mock_runtime) -> None:
+    """Throttling that outlasts botocore's adaptive retries is not retried again."""
+    throttle = ClientError({"Error": {"Code": "ThrottlingException"}}, "InvokeModel")
+    mock_runtime.invoke_model.side_effect = throttle
+    client = bedrock_operations.BedrockClient()
+
+    with pytest.raises(Exception, match="Bedrock embedding generation failed"):
+        client.generate_embedding("text")
+    assert mock_runtime.invoke_model.call_count == 1
+
+
+@patch.object(s3_operations, '_S3')
+def test_write_embeddings_uploads_gzipped_compact_json(mock_s3) -> None:
+    """write_embeddings uploads the document as gzip-compressed compact JSON."""
+    uploaded = {}
+    mock_s3.upload_fileobj.side_effect = lambda fileobj, **kwargs: uploaded.update(
+        body=fileobj.read(), **kwargs
+    )
+    document = {"source_file": "docs/a.txt", "chunk_count": 1}
+
+    s3_operations.S3Client().write_embeddings("bucket", "embeddings/a.json.gz", document)
+
+    assert uploaded["Key"] == "embeddings/a.json.gz"
+    assert uploaded["ExtraArgs"] == {"ContentType": "application/gzip"}
+    content = gzip.decompress(uploaded["body"])
+    assert json.loads(content) == document
+    assert b"\n" not in content
+
+
+@patch.object(bedrock_operations, '_BEDROCK_RUNTIME')
+def test_generate_embeddings_batch_cohere_sends_text_arrays(mock_runtime) -> None:
+    """Cohere models embed many texts per invoke_model call."""
+    mock_runtime.invoke_model.side_effect = lambda modelId, body: {
+        "body": io.BytesIO(
+            json.dumps(
+                {"embeddings": [[float(len(t))] for t in json.loads(body)["texts"]]}
+            ).encode()
+        )
+    }
+    client = bedrock_operations.BedrockClient("cohere.embed-english-v3")
+    texts = ["x" * (i % 7 + 1) for i in range(100)]
+
+    result = client.generate_embeddings_batch(texts)
+
+    assert result == [[float(len(t))] for t in texts]
+    assert mock_runtime.invoke_model.call_count == 2
+
+
+def test_chunk_text_overlaps_and_skips_blank_chunks() -> None:
+    """chunk_text yields stripped overlapping chunks and drops empty ones."""
+    chunker = text_chunker.TextChunker(chunk_size=4, overlap=1)
+
+    assert chunker.chunk_text("abcdefg      ") == ["abcd", "defg", "g"]
+    assert chunker.chunk_text("   ") == []
+
+
+def test_text_chunker_rejects_overlap_not_smaller_than_chunk_size() -> None:
+    """An overlap >= chunk_size would never advance through the text."""
+    with pytest.raises(ValueError):
+        text_chunker.TextChunker(chunk_size=4, overlap=4)
+
+
+@patch.object(textract_operations.time, 'sleep')
+@patch.object(textract_operations, '_TEXTRACT')
+def test_extract_text_from_pdf_backs_off_while_in_progress(mock_textract, mock_sleep) -> None:
+    """Textract polling sleeps with growing delays until the job finishes."""
+    mock_textract.start_document_text_detection.return_value = {"JobId": "job-1"}
+    mock_textract.get_document_text_detection.side_effect = [
+        {"JobStatus": "IN_PROGRESS"},
+        {"JobStatus": "IN_PROGRESS"},
+        {"JobStatus": "SUCCEEDED", "Blocks": [{"BlockType": "LINE", "Text": "Covenant A"}]},
+    ]
+
+    result = textract_operations.TextractClient().extract_text_from_pdf("bucket", "a.pdf")
+
+    assert result == "Covenant A"
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+
+
+@patch.object(textract_operations, '_TEXTRACT')
+def test_extract_text_from_pdf_follows_next_token(mock_textract) -> None:
+    """All Textract result pages are read, not just the first."""
+    mock_textract.start_document_text_detection.return_value = {"JobId": "job-2"}
+    mock_textract.get_document_text_detection.side_effect = [
+        {
+            "JobStatus": "SUCCEEDED",
+            "Blocks": [{"BlockType": "LINE", "Text": "Page 1"}],
+            "NextToken": "token-1",
+        },
+        {"JobStatus": "SUCCEEDED", "Blocks": [{"BlockType": "LINE", "Text": "Page 2"}]},
+    ]
+
+    result = textract_operations.TextractClient().extract_text_from_pdf("bucket", "a.pdf")
+
+    assert result == "Page 1\nPage 2"
+    second_call = mock_textract.get_document_text_detection.call_args_list[1]
+    assert second_call.kwargs == {"JobId": "job-2", "NextToken": "token-1"}
+
+
+def test_generate_chunk_embeddings_only_embeds_cache_misses() -> None:
+    """Cached chunks are read from S3 and only misses go to Bedrock."""
+    mock_s3 = MagicMock()
+    cached_key = embedding_cache.EmbeddingCache._cache_key("model", "cached")
+    mock_s3.read_file_if_exists.side_effect = lambda bucket, key: (
+        array("f", [1.0, 2.0]).tobytes() if key == cached_key else None
+    )
+    embedding_processor = processor.EmbeddingProcessor("model")
+    embedding_processor.embedding_cache = embedding_cache.EmbeddingCache(mock_s3)
+    embedding_processor.bedrock_client = MagicMock(model_id="model")
+    embedding_processor.bedrock_client.generate_embeddings_batch.return_value = [[3.0]]
+
+    result = embedding_processor._generate_chunk_embeddings("bucket", ["cached", "new"])
+
+    assert result == [[1.0, 2.0], [3.0]]
+    embedding_processor.bedrock_client.generate_embeddings_batch.assert_called_once_with(["new"])
+    mock_s3.write_file.assert_called_once()
+    assert mock_s3.read_file_if_exists.call_count == 2
+
+
+def test_generate_chunk_embeddings_embeds_duplicate_chunks_once() -> None:
+    """Repeated chunk text is embedded once and fanned back out."""
+    embedding_processor = processor.EmbeddingProcessor("model")
+    embedding_processor.embedding_cache = MagicMock()
+    embedding_processor.embedding_cache.get_many.side_effect = (
+        lambda bucket, model_id, texts: [None] * len(texts)
+    )
+    embedding_processor.bedrock_client = MagicMock(model_id="model")
+    embedding_processor.bedrock_client.generate_embeddings_batch.return_value = [[1.0], [2.0]]
+
+    result = embedding_processor._generate_chunk_embeddings("bucket", ["a", "b", "a"])
+
+    assert result == [[1.0], [2.0], [1.0]]
+    embedding_processor.bedrock_client.generate_embeddings_batch.assert_called_once_with(["a", "b"])
+
+
+def test_save_embeddings_writes_json_metadata_and_quantized_vectors() -> None:
+    """Vectors go to a uint8-quantized .npz sidecar referenced from the JSON."""
+    embedding_processor = processor.EmbeddingProcessor("model")
+    embedding_processor.s3_client = MagicMock()
+    document = embedding_processor._create_embedding_document(
+        "docs/report.pdf", ["a", "b"], [[1.0, 2.0], [3.0, 4.0]]
+    )
+
+    output_key = embedding_processor.save_embeddings("bucket", "docs/report.pdf", document)
+
+    assert output_key == "embeddings/report_embeddings.json.gz"
+    write_call = embedding_processor.s3_client.write_arrays.call_args
+    vectors_key = write_call.args[1]
+    assert vectors_key == "embeddings/report_embeddings.npz"
+    assert write_call.kwargs["codes"].dtype == np.uint8
+    metadata = embedding_processor.s3_client.write_embeddings.call_args.args[2]
+    assert metadata["embeddings_file"] == vectors_key
+    assert metadata["chunks"] == [
+        {"chunk_index": 0, "text": "a"},
+        {"chunk_index": 1, "text": "b"},
+    ]
+
+
+def test_quantize_uint8_round_trips_within_one_step() -> None:
+    """Dequantized vectors stay within one quantization step of the input."""
+    vectors = np.random.default_rng(0).normal(size=(50, 8)).astype(np.float32)
+
+    codes, scale, offset = quantization.quantize_uint8(vectors)
+    restored = quantization.dequantize_uint8(codes, scale, offset)
+
+    assert codes.dtype == np.uint8
+    assert np.all(np.abs(restored - vectors) <= scale / 2 + 1e-6)
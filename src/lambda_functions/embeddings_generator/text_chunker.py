@@ -1,6 +1,6 @@
 """Text chunking utilities for processing large documents."""
 
-from typing import List
+from typing import Iterator, List, Tuple
 
 from .constants import CHUNK_SIZE, CHUNK_OVERLAP
 
@@ -12,24 +12,27 @@ class TextChunker:
         self, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP
     ) -> None:
         """Initialize text chunker."""
+        if not 0 <= overlap < chunk_size:
+            raise ValueError(
+                f"Overlap must be in [0, chunk_size): {overlap=}, {chunk_size=}"
+            )
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.step = chunk_size - overlap
 
     def chunk_text(self, text: str) -> List[str]:
         """Split text into overlapping chunks."""
         if len(text) <= self.chunk_size:
-            return [text]
-
-        chunks = []
-        start = 0
-
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk = text[start:end]
-
-            if chunk.strip():
-                chunks.append(chunk.strip())
-
-            start = end - self.overlap
-
-        return chunks
+            stripped = text.strip()
+            return [stripped] if stripped else []
+
+        return [
+            chunk
+            for start, end in self._chunk_bounds(len(text))
+            if (chunk := text[start:end].strip())
+        ]
+
+    def _chunk_bounds(self, length: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each chunk window."""
+        starts = range(0, length, self.step)
+        return ((start, start + self.chunk_size) for start in starts)
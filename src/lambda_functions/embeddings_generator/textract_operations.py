@@ -1,10 +1,17 @@
 """Amazon Textract operations for PDF text extraction."""
 
+import time
 from typing import Dict, List
 import boto3
 from botocore.exceptions import ClientError
 
-from .constants import TEXTRACT_MAX_PAGES
+from .constants import (
+    BOTO_CLIENT_CONFIG,
+    TEXTRACT_POLL_INITIAL_SECONDS,
+    TEXTRACT_POLL_MAX_SECONDS,
+)
+
+_TEXTRACT = boto3.client("textract", config=BOTO_CLIENT_CONFIG)
 
 
 class TextractClient:
@@ -12,7 +19,7 @@ class TextractClient:
 
     def __init__(self) -> None:
         """Initialize Textract client."""
-        self.textract_client = boto3.client("textract")
+        self.textract_client = _TEXTRACT
 
     def extract_text_from_pdf(self, bucket: str, key: str) -> str:
         """Extract text and tables from PDF using Textract."""
@@ -26,22 +33,37 @@ class TextractClient:
             raise Exception(f"Textract extraction failed: {str(e)}")
 
     def _get_detection_results(self, job_id: str) -> str:
-        """Poll and retrieve Textract job results."""
-        while True:
+        """Wait for the Textract job and collect LINE text from every result page."""
+        response = self._wait_for_job(job_id)
+        lines = self._parse_lines(response.get("Blocks", []))
+        next_token = response.get("NextToken")
+
+        # Keep only LINE text per page so WORD blocks are freed as we paginate
+        while next_token:
             response = self.textract_client.get_document_text_detection(
-                JobId=job_id, MaxResults=TEXTRACT_MAX_PAGES
+                JobId=job_id, NextToken=next_token
             )
+            lines.extend(self._parse_lines(response.get("Blocks", [])))
+            next_token = response.get("NextToken")
+
+        return "\n".join(lines)
+
+    def _wait_for_job(self, job_id: str) -> Dict:
+        """Poll with exponential backoff and return the first result page."""
+        attempt = 0
+        while True:
+            response = self.textract_client.get_document_text_detection(JobId=job_id)
             status = response["JobStatus"]
 
             if status == "SUCCEEDED":
-                return self._parse_blocks(response["Blocks"])
+                return response
             elif status == "FAILED":
                 raise Exception("Textract job failed")
-            
-
-    def _parse_blocks(self, blocks: List[Dict]) -> str:
-        """Parse Textract blocks to extract text."""
-        text_lines = [
-            block["Text"] for block in blocks if block["BlockType"] == "LINE"
-        ]
-        return "\n".join(text_lines)
+
+            delay = TEXTRACT_POLL_INITIAL_SECONDS * 2**attempt
+            time.sleep(min(TEXTRACT_POLL_MAX_SECONDS, delay))
+            attempt += 1
+
+    def _parse_lines(self, blocks: List[Dict]) -> List[str]:
+        """Extract LINE text from Textract blocks, skipping WORD blocks."""
+        return [block["Text"] for block in blocks if block["BlockType"] == "LINE"]
@@ -2,3 +2,4 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-2")
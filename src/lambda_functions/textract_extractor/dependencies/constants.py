@@ -2,6 +2,8 @@
 
 import os
 
+from botocore.config import Config
+
 TEXTRACT_SNS_TOPIC_ARN = os.environ.get("TEXTRACT_SNS_TOPIC_ARN", "")
 TEXTRACT_ROLE_ARN = os.environ.get("TEXTRACT_ROLE_ARN", "")
 DYNAMODB_TABLE_NAME = os.environ.get("DYNAMODB_TABLE_NAME","")
@@ -9,7 +11,18 @@ OUTPUT_BUCKET = os.environ.get("OUTPUT_BUCKET","")
 EXTRACTED_TEXT_PREFIX = os.environ.get("EXTRACTED_TEXT_PREFIX", "extracted/")
 
 TEXTRACT_MAX_RESULTS = 1000
+S3_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+MAX_CONCURRENT_JOBS = 10
+SQS_MAX_BATCH_SIZE = 10
 
 JOB_STATUS_SUBMITTED = "SUBMITTED"
 JOB_STATUS_COMPLETED = "COMPLETED"
 JOB_STATUS_FAILED = "FAILED"
+
+BOTO_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=25,
+    retries={"mode": "standard", "max_attempts": 3},
+    connect_timeout=3,
+    read_timeout=30,
+)
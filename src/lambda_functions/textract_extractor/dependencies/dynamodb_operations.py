@@ -4,14 +4,20 @@ from datetime import datetime
 from typing import Dict, Optional
 import boto3
 
-from dependencies.constants import DYNAMODB_TABLE_NAME, JOB_STATUS_SUBMITTED
+from dependencies.constants import (
+    BOTO_CLIENT_CONFIG,
+    DYNAMODB_TABLE_NAME,
+    JOB_STATUS_SUBMITTED,
+)
+
+_DYNAMODB = boto3.resource("dynamodb", config=BOTO_CLIENT_CONFIG)
+_JOBS_TABLE = _DYNAMODB.Table(DYNAMODB_TABLE_NAME)
 
 
 def save_job(
     job_id: str, bucket: str, key: str, callback_queue_url: Optional[str]
 ) -> None:
     """Persist a new Textract job record."""
-    table = boto3.resource("dynamodb").Table(DYNAMODB_TABLE_NAME)
     created_at = datetime.now().isoformat()
     item: Dict = {
         "job_id": job_id,
@@ -22,19 +28,17 @@ def save_job(
     }
     if callback_queue_url:
         item["callback_queue_url"] = callback_queue_url
-    table.put_item(Item=item)
+    _JOBS_TABLE.put_item(Item=item)
 
 
 def get_job(job_id: str) -> Dict:
     """Retrieve a Textract job record by job_id."""
-    table = boto3.resource("dynamodb").Table(DYNAMODB_TABLE_NAME)
-    response = table.get_item(Key={"job_id": job_id})
+    response = _JOBS_TABLE.get_item(Key={"job_id": job_id})
     return response.get("Item", {})
 
 
-def update_job_result(job_id: str, output_s3_key: Optional[str], status: str) -> None:
-    """Update job status and output S3 key on completion or failure."""
-    table = boto3.resource("dynamodb").Table(DYNAMODB_TABLE_NAME)
+def update_job_result(job_id: str, output_s3_key: Optional[str], status: str) -> Dict:
+    """Update job status and output S3 key, returning the updated job record."""
     update_expr = "SET #s = :status"
     expr_names = {"#s": "status"}
     expr_values = {":status": status}
@@ -43,9 +47,11 @@ def update_job_result(job_id: str, output_s3_key: Optional[str], status: str) ->
         update_expr += ", output_s3_key = :s3key"
         expr_values[":s3key"] = output_s3_key
 
-    table.update_item(
+    response = _JOBS_TABLE.update_item(
         Key={"job_id": job_id},
         UpdateExpression=update_expr,
         ExpressionAttributeNames=expr_names,
         ExpressionAttributeValues=expr_values,
+        ReturnValues="ALL_NEW",
     )
+    return response.get("Attributes", {})
@@ -1,17 +1,75 @@
 """S3 operations for storing extracted text output."""
 
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List
 import boto3
 
-from dependencies.constants import EXTRACTED_TEXT_PREFIX, OUTPUT_BUCKET
+from dependencies.constants import (
+    BOTO_CLIENT_CONFIG,
+    EXTRACTED_TEXT_PREFIX,
+    OUTPUT_BUCKET,
+    S3_MULTIPART_PART_SIZE,
+)
 
+_S3 = boto3.client("s3", config=BOTO_CLIENT_CONFIG)
 
-def save_extracted_text(job_id: str, text: str) -> str:
-    """Save extracted text to S3 and return the S3 key."""
+
+def save_extracted_text(job_id: str, pages: Iterable[str]) -> str:
+    """Stream newline-joined text pages to S3 and return the S3 key."""
     key = f"{EXTRACTED_TEXT_PREFIX}{job_id}.txt"
-    boto3.client("s3").put_object(
-        Bucket=OUTPUT_BUCKET,
-        Key=key,
-        Body=text.encode("utf-8"),
-        ContentType="text/plain",
-    )
+    parts = _iter_parts(pages)
+    first_part = next(parts, b"")
+    second_part = next(parts, None)
+    if second_part is None:
+        _S3.put_object(
+            Bucket=OUTPUT_BUCKET,
+            Key=key,
+            Body=first_part,
+            ContentType="text/plain",
+        )
+    else:
+        _upload_multipart(key, chain([first_part, second_part], parts))
     return key
+
+
+def _iter_parts(pages: Iterable[str]) -> Iterator[bytes]:
+    """Group UTF-8 encoded pages into chunks of at least the multipart part size."""
+    buffer = bytearray()
+    for index, page in enumerate(pages):
+        if index:
+            buffer += b"\n"
+        buffer += page.encode("utf-8")
+        if len(buffer) >= S3_MULTIPART_PART_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _upload_multipart(key: str, parts: Iterable[bytes]) -> None:
+    """Upload parts as they are produced, aborting the upload on failure."""
+    upload_id = _S3.create_multipart_upload(
+        Bucket=OUTPUT_BUCKET, Key=key, ContentType="text/plain"
+    )["UploadId"]
+    try:
+        completed: List[Dict] = [
+            {"PartNumber": number, "ETag": _upload_part(key, upload_id, number, body)}
+            for number, body in enumerate(parts, start=1)
+        ]
+        _S3.complete_multipart_upload(
+            Bucket=OUTPUT_BUCKET,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+        )
+    except Exception:
+        _S3.abort_multipart_upload(Bucket=OUTPUT_BUCKET, Key=key, UploadId=upload_id)
+        raise
+
+
+def _upload_part(key: str, upload_id: str, number: int, body: bytes) -> str:
+    """Upload one multipart part and return its ETag."""
+    response = _S3.upload_part(
+        Bucket=OUTPUT_BUCKET, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+    )
+    return response["ETag"]
@@ -1,15 +1,42 @@
 """SQS callback operations for notifying callers of completed extraction."""
 
-import json
+from typing import Dict, List, Tuple
 import boto3
+import orjson
+
+from dependencies.constants import BOTO_CLIENT_CONFIG, SQS_MAX_BATCH_SIZE
+
+_SQS = boto3.client("sqs", config=BOTO_CLIENT_CONFIG)
 
 
 def send_callback(queue_url: str, job_id: str, output_s3_key: str) -> None:
     """Send extraction result S3 key to the caller's SQS callback queue."""
-    sqs = boto3.client("sqs")
-    message = {
+    message = _callback_message(job_id, output_s3_key)
+    _SQS.send_message(QueueUrl=queue_url, MessageBody=_encode(message))
+
+
+def send_callbacks(queue_url: str, results: List[Tuple[str, str]]) -> None:
+    """Send (job_id, output_s3_key) results to a callback queue in batches."""
+    for start in range(0, len(results), SQS_MAX_BATCH_SIZE):
+        batch = results[start : start + SQS_MAX_BATCH_SIZE]
+        entries = [
+            {"Id": str(index), "MessageBody": _encode(_callback_message(*result))}
+            for index, result in enumerate(batch)
+        ]
+        response = _SQS.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        if response.get("Failed"):
+            raise RuntimeError(f"Callbacks to {queue_url} failed: {response['Failed']}")
+
+
+def _callback_message(job_id: str, output_s3_key: str) -> Dict:
+    """Build the callback payload for a completed extraction."""
+    return {
         "job_id": job_id,
         "output_s3_key": output_s3_key,
         "status": "COMPLETED",
     }
-    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(message))
+
+
+def _encode(message: Dict) -> str:
+    """Serialize a message body; SQS expects a str, orjson produces bytes."""
+    return orjson.dumps(message).decode()
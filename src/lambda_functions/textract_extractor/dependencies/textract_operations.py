@@ -1,15 +1,22 @@
 """Textract API operations."""
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 import boto3
 
-from dependencies.constants import TEXTRACT_SNS_TOPIC_ARN, TEXTRACT_ROLE_ARN, TEXTRACT_MAX_RESULTS
+from dependencies.constants import (
+    BOTO_CLIENT_CONFIG,
+    TEXTRACT_MAX_RESULTS,
+    TEXTRACT_ROLE_ARN,
+    TEXTRACT_SNS_TOPIC_ARN,
+)
+
+_TEXTRACT = boto3.client("textract", config=BOTO_CLIENT_CONFIG)
 
 
 def start_extraction_job(bucket: str, key: str) -> str:
     """Start an async Textract text detection job and return job_id."""
-    client = boto3.client("textract")
-    response = client.start_document_text_detection(
+    response = _TEXTRACT.start_document_text_detection(
         DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}},
         NotificationChannel={
             "SNSTopicArn": TEXTRACT_SNS_TOPIC_ARN,
@@ -19,26 +26,33 @@ def start_extraction_job(bucket: str, key: str) -> str:
     return response["JobId"]
 
 
-def get_extraction_result(job_id: str) -> str:
-    """Fetch completed Textract job result with pagination."""
-    client = boto3.client("textract")
-    all_blocks: List[Dict] = []
-    next_token = None
-
-    while True:
-        kwargs: Dict = {"JobId": job_id, "MaxResults": TEXTRACT_MAX_RESULTS}
-        if next_token:
-            kwargs["NextToken"] = next_token
-        response = client.get_document_text_detection(**kwargs)
-        all_blocks.extend(response.get("Blocks", []))
-        next_token = response.get("NextToken")
-        if not next_token:
-            break
-
-    return _parse_blocks(all_blocks)
-
-
-def _parse_blocks(blocks: List[Dict]) -> str:
+def get_extraction_result(job_id: str) -> Iterator[str]:
+    """Yield each result page's LINE text, prefetching the next page meanwhile."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        response = _get_result_page(job_id, None)
+        while True:
+            next_token = response.get("NextToken")
+            next_page = (
+                executor.submit(_get_result_page, job_id, next_token)
+                if next_token
+                else None
+            )
+            lines = _parse_lines(response.get("Blocks", []))
+            if lines:
+                yield "\n".join(lines)
+            if next_page is None:
+                break
+            response = next_page.result()
+
+
+def _get_result_page(job_id: str, next_token: Optional[str]) -> Dict:
+    """Fetch one page of Textract text detection results."""
+    kwargs: Dict = {"JobId": job_id, "MaxResults": TEXTRACT_MAX_RESULTS}
+    if next_token:
+        kwargs["NextToken"] = next_token
+    return _TEXTRACT.get_document_text_detection(**kwargs)
+
+
+def _parse_lines(blocks: List[Dict]) -> List[str]:
     """Extract LINE text from Textract blocks."""
-    lines = [b["Text"] for b in blocks if b["BlockType"] == "LINE"]
-    return "\n".join(lines)
+    return [b["Text"] for b in blocks if b["BlockType"] == "LINE"]
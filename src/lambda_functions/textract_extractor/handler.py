@@ -7,18 +7,24 @@ Two invocation modes:
                       sends to callback_queue_url if provided
 """
 
-import json
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from dependencies import dynamodb_operations, s3_operations, sqs_operations
 from dependencies import textract_operations
-from dependencies.constants import JOB_STATUS_COMPLETED, JOB_STATUS_FAILED
+from dependencies.constants import (
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    MAX_CONCURRENT_JOBS,
+)
 
 
 def lambda_handler(event: Dict, context: Any) -> Optional[Dict]:
     """Route event to start-extraction or result-processing."""
     if "Records" in event:
-        _handle_sns_event(event)
+        _handle_notification_event(event)
         return None
     return _handle_start_extraction(event)
 
@@ -35,24 +41,73 @@ def _handle_start_extraction(event: Dict) -> Dict:
     return {"job_id": job_id, "status": "SUBMITTED"}
 
 
-def _handle_sns_event(event: Dict) -> None:
-    """Process Textract completion notifications from SNS."""
-    for record in event["Records"]:
-        message = json.loads(record["Sns"]["Message"])
-        _process_textract_notification(message)
+def _handle_notification_event(event: Dict) -> None:
+    """Process a batch of Textract completion notifications."""
+    messages = [_notification_message(record) for record in event["Records"]]
+    succeeded_job_ids: List[str] = []
+    for message in messages:
+        if message["Status"] == "SUCCEEDED":
+            succeeded_job_ids.append(message["JobId"])
+        else:
+            dynamodb_operations.update_job_result(
+                message["JobId"], None, JOB_STATUS_FAILED
+            )
+
+    if succeeded_job_ids:
+        _process_succeeded_jobs(succeeded_job_ids)
+
+
+def _notification_message(record: Dict) -> Dict:
+    """Decode a Textract notification from an SNS, SNS-to-SQS or raw SQS record."""
+    if "Sns" in record:
+        return orjson.loads(record["Sns"]["Message"])
+    body = orjson.loads(record["body"])
+    # With raw message delivery the SQS body is the notification itself
+    if "Message" not in body:
+        return body
+    return orjson.loads(body["Message"])
+
 
+def _process_succeeded_jobs(job_ids: List[str]) -> None:
+    """Store results concurrently, then record them and notify callers in batches.
 
-def _process_textract_notification(message: Dict) -> None:
-    """Fetch result and notify caller on job completion."""
-    job_id: str = message["JobId"]
-    status: str = message["Status"]
+    Jobs that stored successfully are completed and called back before the first
+    failure is re-raised, so one bad job does not hold back the rest of the batch.
+    """
+    max_workers = min(MAX_CONCURRENT_JOBS, len(job_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            job_id: executor.submit(_store_extraction_result, job_id)
+            for job_id in job_ids
+        }
 
-    if status == "SUCCEEDED":
-        text = textract_operations.get_extraction_result(job_id)
-        output_s3_key = s3_operations.save_extracted_text(job_id, text)
-        dynamodb_operations.update_job_result(job_id, output_s3_key, JOB_STATUS_COMPLETED)
-        job = dynamodb_operations.get_job(job_id)
+    output_s3_keys: Dict[str, str] = {}
+    errors: List[BaseException] = []
+    for job_id, future in futures.items():
+        error = future.exception()
+        if error is None:
+            output_s3_keys[job_id] = future.result()
+        else:
+            errors.append(error)
+
+    # DynamoDB writes stay on this thread; boto3 resources are not thread-safe.
+    callbacks: Dict[str, List[Tuple[str, str]]] = {}
+    for job_id, output_s3_key in output_s3_keys.items():
+        job = dynamodb_operations.update_job_result(
+            job_id, output_s3_key, JOB_STATUS_COMPLETED
+        )
         if job.get("callback_queue_url"):
-            sqs_operations.send_callback(job["callback_queue_url"], job_id, output_s3_key)
-    else:
-        dynamodb_operations.update_job_result(job_id, None, JOB_STATUS_FAILED)
+            callbacks.setdefault(job["callback_queue_url"], []).append(
+                (job_id, output_s3_key)
+            )
+    for queue_url, results in callbacks.items():
+        sqs_operations.send_callbacks(queue_url, results)
+
+    if errors:
+        raise errors[0]
+
+
+def _store_extraction_result(job_id: str) -> str:
+    """Stream a completed job's text pages to S3, returning the S3 key."""
+    pages = textract_operations.get_extraction_result(job_id)
+    return s3_operations.save_extracted_text(job_id, pages)
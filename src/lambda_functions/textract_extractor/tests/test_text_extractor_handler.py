@@ -1,7 +1,9 @@
 """Unit tests for textract_extractor Lambda."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+import pytest
 
 from .. import handler
 from ..dependencies import dynamodb_operations, s3_operations, sqs_operations, textract_operations
@@ -59,7 +61,7 @@ def test_handler_sns_succeeded_with_callback(mock_textract, mock_dynamo, mock_s3
     """SNS SUCCEEDED event saves text to S3, updates DynamoDB with S3 key, sends callback."""
     mock_textract.get_extraction_result.return_value = "Covenant A\nCovenant B"
     mock_s3.save_extracted_text.return_value = "extracted/job-1.txt"
-    mock_dynamo.get_job.return_value = {"job_id": "job-1", "callback_queue_url": "https://sqs/cb"}
+    mock_dynamo.update_job_result.return_value = {"job_id": "job-1", "callback_queue_url": "https://sqs/cb"}
     event = _make_sns_event("job-1", "SUCCEEDED")
 
     result = handler.lambda_handler(event, None)
@@ -67,7 +69,7 @@ def test_handler_sns_succeeded_with_callback(mock_textract, mock_dynamo, mock_s3
     assert result is None
     mock_s3.save_extracted_text.assert_called_once_with("job-1", "Covenant A\nCovenant B")
     mock_dynamo.update_job_result.assert_called_once_with("job-1", "extracted/job-1.txt", "COMPLETED")
-    mock_sqs.send_callback.assert_called_once_with("https://sqs/cb", "job-1", "extracted/job-1.txt")
+    mock_sqs.send_callbacks.assert_called_once_with("https://sqs/cb", [("job-1", "extracted/job-1.txt")])
 
 
 @patch.object(handler, 'sqs_operations')
@@ -78,13 +80,13 @@ def test_handler_sns_succeeded_without_callback(mock_textract, mock_dynamo, mock
     """SNS SUCCEEDED event without callback_queue_url skips send_callback."""
     mock_textract.get_extraction_result.return_value = "Some text"
     mock_s3.save_extracted_text.return_value = "extracted/job-2.txt"
-    mock_dynamo.get_job.return_value = {"job_id": "job-2"}
+    mock_dynamo.update_job_result.return_value = {"job_id": "job-2"}
     event = _make_sns_event("job-2", "SUCCEEDED")
 
     handler.lambda_handler(event, None)
 
     mock_s3.save_extracted_text.assert_called_once()
-    mock_sqs.send_callback.assert_not_called()
+    mock_sqs.send_callbacks.assert_not_called()
 
 
 @patch.object(handler, 'sqs_operations')
@@ -100,16 +102,91 @@ def test_handler_sns_failed(mock_textract, mock_dynamo, mock_s3, mock_sqs) -> No
     mock_dynamo.update_job_result.assert_called_once_with("job-3", None, "FAILED")
     mock_s3.save_extracted_text.assert_not_called()
     mock_textract.get_extraction_result.assert_not_called()
-    mock_sqs.send_callback.assert_not_called()
+    mock_sqs.send_callbacks.assert_not_called()
+
+
+@patch.object(handler, 'sqs_operations')
+@patch.object(handler, 's3_operations')
+@patch.object(handler, 'dynamodb_operations')
+@patch.object(handler, 'textract_operations')
+def test_handler_sns_batch_groups_callbacks(mock_textract, mock_dynamo, mock_s3, mock_sqs) -> None:
+    """A batch of SNS records sends one callback batch per queue."""
+    mock_textract.get_extraction_result.side_effect = lambda job_id: f"text {job_id}"
+    mock_s3.save_extracted_text.side_effect = lambda job_id, text: f"extracted/{job_id}.txt"
+    mock_dynamo.update_job_result.return_value = {"callback_queue_url": "https://sqs/cb"}
+    records = [_make_sns_event(job_id, "SUCCEEDED")["Records"][0] for job_id in ("job-1", "job-2")]
+
+    handler.lambda_handler({"Records": records}, None)
+
+    assert mock_dynamo.update_job_result.call_count == 2
+    mock_dynamo.get_job.assert_not_called()
+    mock_sqs.send_callbacks.assert_called_once_with(
+        "https://sqs/cb", [("job-1", "extracted/job-1.txt"), ("job-2", "extracted/job-2.txt")]
+    )
+
+
+@patch.object(handler, 'sqs_operations')
+@patch.object(handler, 's3_operations')
+@patch.object(handler, 'dynamodb_operations')
+@patch.object(handler, 'textract_operations')
+def test_handler_sns_batch_completes_successes_before_raising(
+    mock_textract, mock_dynamo, mock_s3, mock_sqs
+) -> None:
+    """One failing job still lets the other complete and call back, then raises."""
+    def get_extraction_result(job_id):
+        if job_id == "job-1":
+            raise RuntimeError("textract unavailable")
+        return f"text {job_id}"
+
+    mock_textract.get_extraction_result.side_effect = get_extraction_result
+    mock_s3.save_extracted_text.side_effect = lambda job_id, text: f"extracted/{job_id}.txt"
+    mock_dynamo.update_job_result.return_value = {"callback_queue_url": "https://sqs/cb"}
+    records = [_make_sns_event(job_id, "SUCCEEDED")["Records"][0] for job_id in ("job-1", "job-2")]
+
+    with pytest.raises(RuntimeError, match="textract unavailable"):
+        handler.lambda_handler({"Records": records}, None)
+
+    mock_dynamo.update_job_result.assert_called_once_with(
+        "job-2", "extracted/job-2.txt", "COMPLETED"
+    )
+    mock_sqs.send_callbacks.assert_called_once_with(
+        "https://sqs/cb", [("job-2", "extracted/job-2.txt")]
+    )
+
+
+@patch.object(handler, 'sqs_operations')
+@patch.object(handler, 's3_operations')
+@patch.object(handler, 'dynamodb_operations')
+@patch.object(handler, 'textract_operations')
+def test_handler_sqs_wrapped_sns_notification(mock_textract, mock_dynamo, mock_s3, mock_sqs) -> None:
+    """SNS notifications delivered through an SQS subscription are unwrapped."""
+    envelope = {"Message": json.dumps({"JobId": "job-4", "Status": "FAILED"})}
+    event = {"Records": [{"body": json.dumps(envelope)}]}
+
+    handler.lambda_handler(event, None)
+
+    mock_dynamo.update_job_result.assert_called_once_with("job-4", None, "FAILED")
+
+
+@patch.object(handler, 'sqs_operations')
+@patch.object(handler, 's3_operations')
+@patch.object(handler, 'dynamodb_operations')
+@patch.object(handler, 'textract_operations')
+def test_handler_sqs_raw_delivery_notification(mock_textract, mock_dynamo, mock_s3, mock_sqs) -> None:
+    """With raw message delivery the SQS body is the Textract notification itself."""
+    body = {"JobId": "job-5", "Status": "FAILED"}
+    event = {"Records": [{"body": json.dumps(body)}]}
+
+    handler.lambda_handler(event, None)
+
+    mock_dynamo.update_job_result.assert_called_once_with("job-5", None, "FAILED")
 
 
 # ── Textract operations ───────────────────────────────────────────────────────
 
-@patch.object(textract_operations, 'boto3')
-def test_start_extraction_job_returns_job_id(mock_boto3) -> None:
+@patch.object(textract_operations, '_TEXTRACT')
+def test_start_extraction_job_returns_job_id(mock_client) -> None:
     """start_extraction_job calls Textract with correct params and returns job_id."""
-    mock_client = MagicMock()
-    mock_boto3.client.return_value = mock_client
     mock_client.start_document_text_detection.return_value = {"JobId": "job-new"}
 
     result = textract_operations.start_extraction_job("bucket", "key/file.pdf")
@@ -118,43 +195,37 @@ def test_start_extraction_job_returns_job_id(mock_boto3) -> None:
     mock_client.start_document_text_detection.assert_called_once()
 
 
-@patch.object(textract_operations, 'boto3')
-def test_get_extraction_result_single_page(mock_boto3) -> None:
-    """get_extraction_result returns joined LINE text from single-page response."""
-    mock_client = MagicMock()
-    mock_boto3.client.return_value = mock_client
+@patch.object(textract_operations, '_TEXTRACT')
+def test_get_extraction_result_single_page(mock_client) -> None:
+    """get_extraction_result yields joined LINE text from single-page response."""
     mock_client.get_document_text_detection.return_value = {"Blocks": SAMPLE_BLOCKS}
 
-    result = textract_operations.get_extraction_result("job-1")
+    result = list(textract_operations.get_extraction_result("job-1"))
 
-    assert result == "Covenant A\nCovenant B"
+    assert result == ["Covenant A\nCovenant B"]
 
 
-@patch.object(textract_operations, 'boto3')
-def test_get_extraction_result_multi_page(mock_boto3) -> None:
+@patch.object(textract_operations, '_TEXTRACT')
+def test_get_extraction_result_multi_page(mock_client) -> None:
     """get_extraction_result paginates until NextToken is absent."""
-    mock_client = MagicMock()
-    mock_boto3.client.return_value = mock_client
     mock_client.get_document_text_detection.side_effect = [
         {"Blocks": [{"BlockType": "LINE", "Text": "Page 1"}], "NextToken": "token-1"},
         {"Blocks": [{"BlockType": "LINE", "Text": "Page 2"}]},
     ]
 
-    result = textract_operations.get_extraction_result("job-2")
+    result = list(textract_operations.get_extraction_result("job-2"))
 
-    assert result == "Page 1\nPage 2"
+    assert result == ["Page 1", "Page 2"]
     assert mock_client.get_document_text_detection.call_count == 2
 
 
 # ── S3 operations ─────────────────────────────────────────────────────────────
 
-@patch.object(s3_operations, 'boto3')
-def test_save_extracted_text_uploads_to_s3(mock_boto3) -> None:
-    """save_extracted_text uploads text as UTF-8 and returns the S3 key."""
-    mock_client = MagicMock()
-    mock_boto3.client.return_value = mock_client
+@patch.object(s3_operations, '_S3')
+def test_save_extracted_text_uploads_to_s3(mock_client) -> None:
+    """save_extracted_text uploads small text in one put and returns the S3 key."""
 
-    result = s3_operations.save_extracted_text("job-1", "Covenant A\nCovenant B")
+    result = s3_operations.save_extracted_text("job-1", ["Covenant A", "Covenant B"])
 
     assert result == "extracted/job-1.txt"
     mock_client.put_object.assert_called_once()
@@ -162,15 +233,30 @@ def test_save_extracted_text_uploads_to_s3(mock_boto3) -> None:
     assert call_kwargs["Key"] == "extracted/job-1.txt"
     assert call_kwargs["Body"] == b"Covenant A\nCovenant B"
     assert call_kwargs["ContentType"] == "text/plain"
+    mock_client.create_multipart_upload.assert_not_called()
+
+
+@patch.object(s3_operations, 'S3_MULTIPART_PART_SIZE', 8)
+@patch.object(s3_operations, '_S3')
+def test_save_extracted_text_streams_multipart(mock_client) -> None:
+    """save_extracted_text switches to a multipart upload once text exceeds one part."""
+    mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_client.upload_part.side_effect = [{"ETag": "etag-1"}, {"ETag": "etag-2"}]
+
+    s3_operations.save_extracted_text("job-1", ["Covenant A", "Covenant B"])
+
+    bodies = [call[1]["Body"] for call in mock_client.upload_part.call_args_list]
+    assert bodies == [b"Covenant A", b"\nCovenant B"]
+    parts = mock_client.complete_multipart_upload.call_args[1]["MultipartUpload"]["Parts"]
+    assert parts == [{"PartNumber": 1, "ETag": "etag-1"}, {"PartNumber": 2, "ETag": "etag-2"}]
+    mock_client.put_object.assert_not_called()
 
 
 # ── DynamoDB operations ───────────────────────────────────────────────────────
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_save_job_with_callback(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_save_job_with_callback(mock_table) -> None:
     """save_job includes callback_queue_url in DynamoDB item when provided."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
 
     dynamodb_operations.save_job("job-1", "bucket", "key.pdf", "https://sqs/queue")
 
@@ -179,11 +265,9 @@ def test_save_job_with_callback(mock_boto3) -> None:
     assert item["status"] == "SUBMITTED"
 
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_save_job_without_callback(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_save_job_without_callback(mock_table) -> None:
     """save_job omits callback_queue_url from DynamoDB item when None."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
 
     dynamodb_operations.save_job("job-2", "bucket", "key.pdf", None)
 
@@ -191,11 +275,9 @@ def test_save_job_without_callback(mock_boto3) -> None:
     assert "callback_queue_url" not in item
 
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_get_job_returns_item(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_get_job_returns_item(mock_table) -> None:
     """get_job returns the DynamoDB item for a known job_id."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
     mock_table.get_item.return_value = {"Item": {"job_id": "job-1", "status": "COMPLETED"}}
 
     result = dynamodb_operations.get_job("job-1")
@@ -203,11 +285,9 @@ def test_get_job_returns_item(mock_boto3) -> None:
     assert result["job_id"] == "job-1"
 
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_get_job_returns_empty_when_not_found(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_get_job_returns_empty_when_not_found(mock_table) -> None:
     """get_job returns empty dict when job_id does not exist."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
     mock_table.get_item.return_value = {}
 
     result = dynamodb_operations.get_job("missing-job")
@@ -215,24 +295,21 @@ def test_get_job_returns_empty_when_not_found(mock_boto3) -> None:
     assert result == {}
 
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_update_job_result_with_s3_key(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_update_job_result_with_s3_key(mock_table) -> None:
     """update_job_result stores output_s3_key in DynamoDB when provided."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
 
     dynamodb_operations.update_job_result("job-1", "extracted/job-1.txt", "COMPLETED")
 
     kwargs = mock_table.update_item.call_args[1]
+    assert kwargs["ReturnValues"] == "ALL_NEW"
     assert ":s3key" in kwargs["ExpressionAttributeValues"]
     assert kwargs["ExpressionAttributeValues"][":s3key"] == "extracted/job-1.txt"
 
 
-@patch.object(dynamodb_operations, 'boto3')
-def test_update_job_result_without_s3_key(mock_boto3) -> None:
+@patch.object(dynamodb_operations, '_JOBS_TABLE')
+def test_update_job_result_without_s3_key(mock_table) -> None:
     """update_job_result omits output_s3_key from update when None (FAILED case)."""
-    mock_table = MagicMock()
-    mock_boto3.resource.return_value.Table.return_value = mock_table
 
     dynamodb_operations.update_job_result("job-1", None, "FAILED")
 
@@ -242,11 +319,9 @@ def test_update_job_result_without_s3_key(mock_boto3) -> None:
 
 # ── SQS operations ────────────────────────────────────────────────────────────
 
-@patch.object(sqs_operations, 'boto3')
-def test_send_callback_sends_s3_key(mock_boto3) -> None:
+@patch.object(sqs_operations, '_SQS')
+def test_send_callback_sends_s3_key(mock_sqs) -> None:
     """send_callback sends job_id, output_s3_key, and COMPLETED status to queue."""
-    mock_sqs = MagicMock()
-    mock_boto3.client.return_value = mock_sqs
 
     sqs_operations.send_callback("https://sqs/queue", "job-1", "extracted/job-1.txt")
 
@@ -257,3 +332,16 @@ def test_send_callback_sends_s3_key(mock_boto3) -> None:
     assert body["job_id"] == "job-1"
     assert body["output_s3_key"] == "extracted/job-1.txt"
     assert body["status"] == "COMPLETED"
+
+
+@patch.object(sqs_operations, '_SQS')
+def test_send_callbacks_batches_messages(mock_sqs) -> None:
+    """send_callbacks sends results in batches of at most ten messages."""
+    mock_sqs.send_message_batch.return_value = {"Successful": []}
+    results = [(f"job-{index}", f"extracted/job-{index}.txt") for index in range(12)]
+
+    sqs_operations.send_callbacks("https://sqs/queue", results)
+
+    batches = [call[1]["Entries"] for call in mock_sqs.send_message_batch.call_args_list]
+    assert [len(entries) for entries in batches] == [10, 2]
+    assert json.loads(batches[1][1]["MessageBody"])["job_id"] == "job-11"
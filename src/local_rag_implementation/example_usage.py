@@ -46,7 +46,8 @@ def example_usage_task():
     rag = RAGSystem(
         embedding_model_name='all-MiniLM-L6-v2',
         bedrock_model_id='amazon.nova-2-lite-v1:0',
-        aws_region='us-east-2'
+        aws_region='us-east-2',
+        embedding_cache_path='embedding_cache.sqlite'
     )
     print("RAG system initialized \n")
     
@@ -57,7 +58,7 @@ def example_usage_task():
     
     # Save the index
     print("💾 Saving vector store...")
-    rag.save('faiss_index.bin', 'documents.json')
+    rag.save('faiss_index.bin', 'documents.pkl')
     print()
     
     # Example queries
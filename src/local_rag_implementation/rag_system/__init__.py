@@ -3,17 +3,42 @@ RAG (Retrieval-Augmented Generation) System - Version 1
 A production-ready implementation using AWS services and modern embedding models
 """
 
-from typing import List, Dict, Any
+import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional
+import numpy as np
 from dotenv import load_dotenv
 
 from .document import Document
-from .bedrock_llm import BedrockLLM
-from .document_processor import DocumentProcessor
-from .embedding_model import EmbeddingModel
-from .vector_store import VectorStore
 
 load_dotenv()
 
+# Chunks embedded and indexed per step; bounds ingestion memory
+INGEST_WINDOW_SIZE = 4096
+# PDF parsing is largely I/O, so a few loader threads overlap it with encoding
+LOAD_MAX_WORKERS = 4
+
+_PROMPT_TEMPLATE = """You are a helpful assistant answering questions based on the provided context. Context: {context}. Question: {query}. Please provide a comprehensive answer based on the context above. If the context doesn't contain enough information to fully answer the question, acknowledge this limitation. Answer:"""
+
+# Heavy components (boto3, torch, faiss, langchain) load on first access
+_LAZY_ATTRIBUTES = {
+    'BedrockLLM': '.bedrock_llm',
+    'DocumentProcessor': '.document_processor',
+    'EmbeddingModel': '.embedding_model',
+    'VectorStore': '.vector_store',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy submodules only when their classes are requested"""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    return getattr(module, name)
+
+
 class RAGSystem:
     """Complete RAG system orchestrating all components"""
     
@@ -21,33 +46,81 @@ class RAGSystem:
         self,
         embedding_model_name: str = 'all-MiniLM-L6-v2',
         bedrock_model_id: str = 'amazon.nova-2-lite-v1:0',
-        aws_region: str = 'us-east-2'
+        aws_region: str = 'us-east-2',
+        embedding_cache_path: Optional[str] = None
     ):
+        from .bedrock_llm import BedrockLLM
+        from .document_processor import DocumentProcessor
+        from .embedding_cache import EmbeddingCache
+        from .embedding_model import EmbeddingModel
+        from .vector_store import VectorStore
+
         self.embedding_model = EmbeddingModel(embedding_model_name)
         self.vector_store = VectorStore(self.embedding_model.embedding_dim)
         self.document_processor = DocumentProcessor()
         self.llm = BedrockLLM(bedrock_model_id, aws_region)
+        # Opt-in, since the working directory may be read-only (e.g. /var/task on Lambda)
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_path, embedding_model_name)
+            if embedding_cache_path
+            else None
+        )
     
     def ingest_documents(self, file_paths: List[str]):
         """Ingest multiple documents into the RAG system"""
-        all_documents = []
+        documents = self._iter_file_documents(file_paths)
+        total = 0
         
-        for file_path in file_paths:
-            print(f"Processing {file_path}...")
-            documents = self.document_processor.load_document(file_path)
-            
-            # Generate embeddings
-            texts = [doc.content for doc in documents]
-            embeddings = self.embedding_model.embed_batch(texts)
+        # Embed fixed-size windows of chunks so memory stays bounded
+        while window := list(islice(documents, INGEST_WINDOW_SIZE)):
+            embeddings = self._embed_with_cache([doc.content for doc in window])
             
-            for doc, embedding in zip(documents, embeddings):
+            for doc, embedding in zip(window, embeddings):
                 doc.embedding = embedding
             
-            all_documents.extend(documents)
+            # Add to vector store, handing over the matrix to avoid a re-stack
+            self.vector_store.add_documents(window, embeddings)
+            total += len(window)
         
-        # Add to vector store
-        self.vector_store.add_documents(all_documents)
-        print(f"Ingested {len(all_documents)} document chunks")
+        print(f"Ingested {total} document chunks")
+    
+    def _embed_with_cache(self, texts: List[str]) -> np.ndarray:
+        """Embed only texts not already cached, and each distinct text once"""
+        if self.embedding_cache is None:
+            return self.embedding_model.embed_batch(texts)
+        
+        keys = [self.embedding_cache.key(text) for text in texts]
+        embeddings = self.embedding_cache.get_many(keys)
+        pending = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+        
+        if pending:
+            vectors = self.embedding_model.embed_batch(list(pending.values()))
+            fresh = dict(zip(pending, vectors))
+            self.embedding_cache.put_many(fresh)
+            embeddings |= fresh
+        
+        return np.stack([embeddings[key] for key in keys])
+    
+    def _iter_file_documents(self, file_paths: List[str]) -> Iterator[Document]:
+        """Stream chunks file by file with at most LOAD_MAX_WORKERS files loading ahead"""
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=LOAD_MAX_WORKERS) as executor:
+            pending = deque(
+                (path, executor.submit(self._load_file, path))
+                for path in islice(paths, LOAD_MAX_WORKERS)
+            )
+            while pending:
+                file_path, future = pending.popleft()
+                print(f"Processing {file_path}...")
+                documents = future.result()
+                # Refill only as files are consumed so loaded chunks never pile up
+                if (path := next(paths, None)) is not None:
+                    pending.append((path, executor.submit(self._load_file, path)))
+                yield from documents
+    
+    def _load_file(self, file_path: str) -> List[Document]:
+        """Load and chunk one file on a loader thread"""
+        return list(self.document_processor.iter_documents(file_path))
     
 
     def retrieve(self, query: str, k: int = 5) -> List[tuple[Document, float]]:
@@ -63,16 +136,13 @@ class RAGSystem:
         retrieved_docs = self.retrieve(query, k)
         
         # Build context from retrieved documents
-        context_parts = []
-        for idx, (doc, score) in enumerate(retrieved_docs, 1):
-            context_parts.append(f"[Document {idx}]")
-            context_parts.append(doc.content)
-            context_parts.append("")
-        
-        context = "\n".join(context_parts)
+        context = "\n\n".join(
+            f"[Document {idx}]\n{doc.content}"
+            for idx, (doc, _) in enumerate(retrieved_docs, 1)
+        )
         
         # Build prompt
-        prompt = f"""You are a helpful assistant answering questions based on the provided context. Context: {context}. Question: {query}. Please provide a comprehensive answer based on the context above. If the context doesn't contain enough information to fully answer the question, acknowledge this limitation. Answer:"""
+        prompt = _PROMPT_TEMPLATE.format(context=context, query=query)
         
         # Generate response
         response = self.llm.generate(prompt)
@@ -91,13 +161,13 @@ class RAGSystem:
         }
     
 
-    def save(self, index_path: str = 'faiss_index.bin', docs_path: str = 'documents.json'):
+    def save(self, index_path: str = 'faiss_index.bin', docs_path: str = 'documents.pkl'):
         """Save the vector store to disk"""
         self.vector_store.save(index_path, docs_path)
         print(f"Saved vector store to {index_path} and {docs_path}")
     
     
-    def load(self, index_path: str = 'faiss_index.bin', docs_path: str = 'documents.json'):
+    def load(self, index_path: str = 'faiss_index.bin', docs_path: str = 'documents.pkl'):
         """Load the vector store from disk"""
         self.vector_store.load(index_path, docs_path)
         print(f"Loaded vector store from {index_path} and {docs_path}")
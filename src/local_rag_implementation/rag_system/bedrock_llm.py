@@ -1,26 +1,50 @@
-import json
-import boto3
+from typing import Any, Dict, Tuple
+import orjson
+
+# Generation can run for tens of seconds, so allow a longer read timeout
+_CLIENT_CONFIG_OPTIONS: Dict[str, Any] = {
+    'tcp_keepalive': True,
+    'max_pool_connections': 25,
+    'retries': {'mode': 'standard', 'max_attempts': 3},
+    'connect_timeout': 3,
+    'read_timeout': 120,
+}
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+# Only the values change per call; orjson escapes the prompt as a JSON string
+_REQUEST_BODY_TEMPLATE = (
+    b'{"max_tokens":%d,"temperature":%b,'
+    b'"messages":[{"role":"user","content":%b}]}'
+)
+
+
+def _get_client(service: str, region: str) -> Any:
+    """Return a cached boto3 client for (service, region)"""
+    key = (service, region)
+    if key not in _CLIENTS:
+        # Deferred so importing rag_system does not pay boto3 start-up
+        import boto3
+        from botocore.config import Config
+
+        config = Config(**_CLIENT_CONFIG_OPTIONS)
+        _CLIENTS[key] = boto3.client(service, region_name=region, config=config)
+    return _CLIENTS[key]
+
 
 class BedrockLLM:
     """AWS Bedrock integration for LLM responses"""
     
     def __init__(self, model_id: str = 'amazon.nova-2-lite-v1:0', region: str = 'us-east-2'):
         self.model_id = model_id
-        self.bedrock = boto3.client('bedrock-runtime', region_name=region)
+        self.bedrock = _get_client('bedrock-runtime', region)
     
     def generate(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7) -> str:
         """Generate response using Bedrock"""
         
-        body = json.dumps({
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        })
+        body = _REQUEST_BODY_TEMPLATE % (
+            max_tokens,
+            orjson.dumps(temperature),
+            orjson.dumps(prompt)
+        )
         
         try:
             response = self.bedrock.invoke_model(
@@ -28,7 +52,7 @@ class BedrockLLM:
                 body=body
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
             return response_body['output']['message']['content'][0]['text']
         
         except Exception as e:
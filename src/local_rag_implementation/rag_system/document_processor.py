@@ -1,14 +1,24 @@
 
 import numpy as np
 from pathlib import Path
-from typing import List
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from typing import Iterator, List
+from functools import lru_cache
 from .document import Document
-from langchain_community.document_loaders import (
-    PyPDFLoader,
-    TextLoader,
-    UnstructuredMarkdownLoader
-)
+from .text_splitter import RegexTextSplitter
+
+# Loader class names by file suffix, imported on first use
+_LOADERS = {
+    '.pdf': 'PyPDFLoader',
+    '.txt': 'TextLoader',
+    '.md': 'UnstructuredMarkdownLoader',
+}
+
+
+@lru_cache(maxsize=None)
+def _loader_class(name: str) -> type:
+    """Import a LangChain loader class only when a file needs it"""
+    from langchain_community import document_loaders
+    return getattr(document_loaders, name)
 
 
 
@@ -18,39 +28,29 @@ class DocumentProcessor:
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
+        self.text_splitter = RegexTextSplitter(chunk_size, chunk_overlap)
     
     def load_document(self, file_path: str) -> List[Document]:
         """Load and chunk a document based on file type"""
+        return list(self.iter_documents(file_path))
+    
+    def iter_documents(self, file_path: str) -> Iterator[Document]:
+        """Lazily load, chunk and yield a document one chunk at a time"""
         file_path = Path(file_path)
+        source = str(file_path)
         
         # Select appropriate loader
-        if file_path.suffix == '.pdf':
-            loader = PyPDFLoader(str(file_path))
-        elif file_path.suffix == '.txt':
-            loader = TextLoader(str(file_path))
-        elif file_path.suffix == '.md':
-            loader = UnstructuredMarkdownLoader(str(file_path))
-        else:
+        loader_name = _LOADERS.get(file_path.suffix)
+        if loader_name is None:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        loader = _loader_class(loader_name)(source)
         
-        # Load and split
-        documents = loader.load()
-        chunks = self.text_splitter.split_documents(documents)
-        
-        # Convert to our Document format
-        return [
-            Document(
-                content=chunk.page_content,
-                metadata={
-                    **chunk.metadata,
-                    'source': str(file_path),
-                    'chunk_index': idx
-                }
-            )
-            for idx, chunk in enumerate(chunks)
-        ]
+        # Split page by page, carrying each page's metadata onto its chunks
+        chunk_index = 0
+        for page in loader.lazy_load():
+            for chunk in self.text_splitter.split_text(page.page_content):
+                yield Document(
+                    content=chunk,
+                    metadata=page.metadata | {'source': source, 'chunk_index': chunk_index}
+                )
+                chunk_index += 1
@@ -0,0 +1,44 @@
+import hashlib
+import sqlite3
+import numpy as np
+from typing import Dict, List
+
+# Stay under SQLite's bound-parameter limit on older builds
+_SELECT_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by a BLAKE2b hash of model and text"""
+    
+    def __init__(self, path: str = 'embedding_cache.sqlite', model_name: str = ''):
+        self.model_name = model_name
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)'
+        )
+    
+    def key(self, text: str) -> bytes:
+        """Hash text together with the model name so models never share entries"""
+        return hashlib.blake2b(
+            f"{self.model_name}\0{text}".encode('utf-8'), digest_size=16
+        ).digest()
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Return cached float32 embeddings for whichever keys are present"""
+        found = {}
+        for start in range(0, len(keys), _SELECT_BATCH_SIZE):
+            batch = keys[start:start + _SELECT_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.connection.execute(
+                f'SELECT key, vector FROM embeddings WHERE key IN ({placeholders})', batch
+            )
+            found.update((key, np.frombuffer(vector, dtype=np.float32)) for key, vector in rows)
+        return found
+    
+    def put_many(self, embeddings: Dict[bytes, np.ndarray]):
+        """Store float32 embeddings by key"""
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)',
+                ((key, vector.astype(np.float32).tobytes()) for key, vector in embeddings.items())
+            )
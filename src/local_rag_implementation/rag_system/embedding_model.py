@@ -1,20 +1,34 @@
-
 import numpy as np
-from typing import List
+import torch
+from typing import Dict, List
 from sentence_transformers import SentenceTransformer
 
+# Loaded models are shared across EmbeddingModel instances in this process
+_MODEL_CACHE: Dict[str, SentenceTransformer] = {}
+
 
 class EmbeddingModel:
     """Wrapper for sentence transformer embeddings"""
     
     def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
-        self.model = SentenceTransformer(model_name)
+        if model_name not in _MODEL_CACHE:
+            _MODEL_CACHE[model_name] = SentenceTransformer(model_name)
+        self.model = _MODEL_CACHE[model_name]
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
     
     def embed_text(self, text: str) -> np.ndarray:
         """Generate embedding for a single text"""
-        return self.model.encode(text)
+        with torch.inference_mode():
+            embedding = self.model.encode(text, convert_to_numpy=True)
+        return embedding.astype(np.float32, copy=False)
     
-    def embed_batch(self, texts: List[str]) -> np.ndarray:
+    def embed_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
         """Generate embeddings for multiple texts"""
-        return self.model.encode(texts, show_progress_bar=True)
\ No newline at end of file
+        with torch.inference_mode():
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+        return embeddings.astype(np.float32, copy=False)
@@ -0,0 +1,40 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import List
+
+# Split points, all equally preferred: chunks may cross paragraph or line breaks
+_SEPARATOR_PATTERN = re.compile(r"\n\n|\n|\. | ")
+
+
+class RegexTextSplitter:
+    """Single-pass chunker that packs text up to separator boundaries"""
+    
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be >= 0 and smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+    
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks of at most chunk_size characters"""
+        boundaries = [0, *(m.end() for m in _SEPARATOR_PATTERN.finditer(text)), len(text)]
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = boundaries[bisect_right(boundaries, start + self.chunk_size) - 1]
+            if end <= start:
+                # No separator inside the window, so cut mid-word
+                end = start + self.chunk_size
+            if chunk := text[start:end].strip():
+                chunks.append(chunk)
+            if end >= len(text):
+                break
+            start = self._next_start(boundaries, start, end)
+        return chunks
+    
+    def _next_start(self, boundaries: List[int], start: int, end: int) -> int:
+        """Step back from end by up to chunk_overlap, snapping to a boundary"""
+        target = max(end - self.chunk_overlap, start + 1)
+        next_start = boundaries[bisect_left(boundaries, target)]
+        # Past end only after a mid-word cut, which overlaps by raw characters
+        return next_start if next_start <= end else target
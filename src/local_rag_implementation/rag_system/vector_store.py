@@ -1,56 +1,76 @@
 import faiss
 import numpy as np
-import json
-from typing import List
+import pickle
+from typing import List, Optional
 from .document import Document
 
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+PICKLE_PROTOCOL = 5
+
 class VectorStore:
-    """FAISS-based vector storage with persistence"""
+    """FAISS HNSW cosine-similarity vector storage with fp16 codes"""
     
     def __init__(self, embedding_dim: int = 384):
         self.embedding_dim = embedding_dim
-        self.index = faiss.IndexFlatL2(embedding_dim)
+        self.index = faiss.IndexHNSWSQ(
+            embedding_dim,
+            faiss.ScalarQuantizer.QT_fp16,
+            HNSW_NEIGHBORS,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        self.index.hnsw.efSearch = HNSW_EF_SEARCH
         self.documents: List[Document] = []
     
-    def add_documents(self, documents: List[Document]):
-        """Add documents with embeddings to the index"""
-        embeddings = np.array([doc.embedding for doc in documents]).astype('float32')
+    def add_documents(self, documents: List[Document], embeddings: Optional[np.ndarray] = None):
+        """Add documents to the index; a float32 embeddings matrix is normalized in place"""
+        if embeddings is None:
+            embeddings = np.empty((len(documents), self.embedding_dim), dtype=np.float32)
+            for i, doc in enumerate(documents):
+                embeddings[i] = doc.embedding
+        faiss.normalize_L2(embeddings)
         self.index.add(embeddings)
         self.documents.extend(documents)
     
     def search(self, query_embedding: np.ndarray, k: int = 5) -> List[tuple[Document, float]]:
         """Search for k most similar documents"""
-        query_embedding = query_embedding.astype('float32').reshape(1, -1)
-        distances, indices = self.index.search(query_embedding, k)
+        # Per-call copy: FAISS drops the GIL, so a shared buffer would race
+        query = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(query)
+        similarities, indices = self.index.search(query, k)
         
         results = []
-        for idx, distance in zip(indices[0], distances[0]):
-            if idx < len(self.documents):
-                results.append((self.documents[idx], float(distance)))
+        for idx, similarity in zip(indices[0], similarities[0]):
+            # HNSW pads missing neighbours with -1
+            if 0 <= idx < len(self.documents):
+                results.append((self.documents[idx], float(similarity)))
         
         return results
     
     def save(self, index_path: str, docs_path: str):
         """Save index and documents to disk"""
         faiss.write_index(self.index, index_path)
-        with open(docs_path, 'w') as f:
-            json.dump([
-                {
-                    'content': doc.content,
-                    'metadata': doc.metadata
-                }
-                for doc in self.documents
-            ], f)
+        with open(docs_path, 'wb') as f:
+            pickle.dump(
+                [(doc.content, doc.metadata) for doc in self.documents],
+                f,
+                protocol=PICKLE_PROTOCOL
+            )
     
     def load(self, index_path: str, docs_path: str):
-        """Load index and documents from disk"""
-        self.index = faiss.read_index(index_path)
-        with open(docs_path, 'r') as f:
-            docs_data = json.load(f)
+        """Load index and documents from disk; only load files you trust"""
+        index = faiss.read_index(index_path)
+        if not isinstance(index, faiss.IndexHNSW):
+            raise ValueError(
+                f"{index_path} holds a {type(index).__name__}, not an HNSW index; "
+                "re-ingest the documents to rebuild it"
+            )
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        self.index = index
+        with open(docs_path, 'rb') as f:
             self.documents = [
-                Document(
-                    content=d['content'],
-                    metadata=d['metadata']
-                )
-                for d in docs_data
-            ]
\ No newline at end of file
+                Document(content=content, metadata=metadata)
+                for content, metadata in pickle.load(f)
+            ]
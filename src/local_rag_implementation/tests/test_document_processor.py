@@ -0,0 +1,47 @@
+"""Unit tests for DocumentProcessor's page-by-page chunking."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from rag_system import document_processor
+from rag_system.document_processor import DocumentProcessor
+
+PAGES = [
+    SimpleNamespace(page_content="alpha beta gamma delta", metadata={'page': 0}),
+    SimpleNamespace(page_content="epsilon zeta eta theta", metadata={'page': 1}),
+]
+
+
+class _StubLoader:
+    """Stands in for a LangChain loader, yielding two fixed pages."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def lazy_load(self):
+        yield from PAGES
+
+
+@patch.object(document_processor, '_loader_class', return_value=_StubLoader)
+def test_iter_documents_numbers_chunks_across_pages(mock_loader_class) -> None:
+    """chunk_index runs on across pages and each chunk keeps its page's metadata."""
+    processor = DocumentProcessor(chunk_size=12, chunk_overlap=0)
+
+    documents = list(processor.iter_documents("covenants.pdf"))
+
+    mock_loader_class.assert_called_once_with('PyPDFLoader')
+    assert [doc.metadata['chunk_index'] for doc in documents] == list(range(len(documents)))
+    assert {doc.metadata['page'] for doc in documents} == {0, 1}
+    for doc in documents:
+        assert doc.metadata['source'] == "covenants.pdf"
+        assert doc.content in PAGES[doc.metadata['page']].page_content
+    # Page metadata is copied, never mutated
+    assert PAGES[0].metadata == {'page': 0}
+
+
+def test_iter_documents_rejects_unsupported_suffix() -> None:
+    """Unknown file types fail before any loader is imported."""
+    with pytest.raises(ValueError, match="Unsupported file type: .docx"):
+        list(DocumentProcessor().iter_documents("covenants.docx"))
@@ -0,0 +1,103 @@
+"""Unit tests for the SQLite embedding cache and RAGSystem's cached embedding path."""
+
+import numpy as np
+import pytest
+
+from rag_system import RAGSystem
+from rag_system.embedding_cache import EmbeddingCache
+
+
+class _FakeEmbeddingModel:
+    """Records embed_batch calls and returns one distinct vector per text."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+def _make_rag(cache):
+    rag = object.__new__(RAGSystem)
+    rag.embedding_model = _FakeEmbeddingModel()
+    rag.embedding_cache = cache
+    return rag
+
+
+# ── EmbeddingCache ────────────────────────────────────────────────────────────
+
+def test_cache_round_trips_float32_vectors(tmp_path) -> None:
+    """put_many then get_many returns the stored float32 vectors by key."""
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model")
+    key = cache.key("text")
+
+    cache.put_many({key: np.array([0.5, -1.5], dtype=np.float32)})
+
+    found = cache.get_many([key, cache.key("missing")])
+    assert list(found) == [key]
+    assert found[key].dtype == np.float32
+    assert found[key].tolist() == [0.5, -1.5]
+
+
+def test_cache_keys_depend_on_model(tmp_path) -> None:
+    """The same text embedded by different models never shares a key."""
+    path = str(tmp_path / "cache.sqlite")
+
+    assert EmbeddingCache(path, "a").key("text") != EmbeddingCache(path, "b").key("text")
+
+
+def test_cache_persists_across_connections(tmp_path) -> None:
+    """Entries written by one cache instance are visible to the next."""
+    path = str(tmp_path / "cache.sqlite")
+    first = EmbeddingCache(path, "model")
+    first.put_many({first.key("text"): np.ones(2, dtype=np.float32)})
+
+    second = EmbeddingCache(path, "model")
+
+    assert second.key("text") in second.get_many([second.key("text")])
+
+
+def test_cache_get_many_handles_more_keys_than_one_select(tmp_path) -> None:
+    """Lookups larger than one SELECT batch are split and merged."""
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model")
+    keys = [cache.key(str(index)) for index in range(1200)]
+    cache.put_many({key: np.zeros(1, dtype=np.float32) for key in keys})
+
+    assert len(cache.get_many(keys)) == 1200
+
+
+# ── RAGSystem._embed_with_cache ───────────────────────────────────────────────
+
+def test_embed_with_cache_embeds_only_distinct_misses(tmp_path) -> None:
+    """Cached texts are reused and duplicate misses are embedded once."""
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model")
+    cache.put_many({cache.key("cached"): np.array([9.0, 9.0], dtype=np.float32)})
+    rag = _make_rag(cache)
+
+    result = rag._embed_with_cache(["new", "cached", "new"])
+
+    assert rag.embedding_model.calls == [["new"]]
+    assert result.tolist() == [[3.0, 1.0], [9.0, 9.0], [3.0, 1.0]]
+    assert cache.key("new") in cache.get_many([cache.key("new")])
+
+
+def test_embed_with_cache_skips_model_on_full_hit(tmp_path) -> None:
+    """Re-embedding already cached texts never calls the model."""
+    rag = _make_rag(EmbeddingCache(str(tmp_path / "cache.sqlite"), "model"))
+    rag._embed_with_cache(["a", "bb"])
+
+    result = rag._embed_with_cache(["bb", "a"])
+
+    assert rag.embedding_model.calls == [["a", "bb"]]
+    assert result.tolist() == [[2.0, 1.0], [1.0, 1.0]]
+
+
+def test_embed_with_cache_disabled_embeds_everything() -> None:
+    """Without a cache every text goes straight to the model."""
+    rag = _make_rag(None)
+
+    result = rag._embed_with_cache(["a", "a"])
+
+    assert rag.embedding_model.calls == [["a", "a"]]
+    assert result.shape == (2, 2)
@@ -0,0 +1,63 @@
+"""Unit tests for RAGSystem.ingest_documents' windowed, prefetching pipeline."""
+
+import random
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+import rag_system
+from rag_system import RAGSystem
+from rag_system.document import Document
+from rag_system.vector_store import VectorStore
+
+EMBEDDING_DIM = 8
+CHUNKS_PER_FILE = 3
+
+
+class _FakeDocumentProcessor:
+    """Yields a few chunks per file after a random delay, so loads finish out of order."""
+
+    def iter_documents(self, file_path):
+        time.sleep(random.uniform(0, 0.01))
+        for chunk_index in range(CHUNKS_PER_FILE):
+            yield Document(
+                content=f"{file_path}:{chunk_index}",
+                metadata={'source': file_path, 'chunk_index': chunk_index},
+            )
+
+
+class _FakeEmbeddingModel:
+    """Returns one random vector per text and records each batch size."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def embed_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return np.random.default_rng(len(self.batch_sizes)).standard_normal(
+            (len(texts), EMBEDDING_DIM)
+        ).astype(np.float32)
+
+
+def _make_rag():
+    rag = object.__new__(RAGSystem)
+    rag.document_processor = _FakeDocumentProcessor()
+    rag.embedding_model = _FakeEmbeddingModel()
+    rag.embedding_cache = None
+    rag.vector_store = VectorStore(EMBEDDING_DIM)
+    return rag
+
+
+def test_ingest_keeps_input_order_across_windows() -> None:
+    """More files than loader threads, in small windows, index every chunk in order."""
+    file_paths = [f"file-{i}.pdf" for i in range(rag_system.LOAD_MAX_WORKERS * 3 + 1)]
+    rag = _make_rag()
+
+    with patch.object(rag_system, 'INGEST_WINDOW_SIZE', 5):
+        rag.ingest_documents(file_paths)
+
+    expected = [f"{path}:{i}" for path in file_paths for i in range(CHUNKS_PER_FILE)]
+    assert [doc.content for doc in rag.vector_store.documents] == expected
+    assert rag.vector_store.index.ntotal == len(expected)
+    assert max(rag.embedding_model.batch_sizes) == 5
@@ -0,0 +1,86 @@
+"""Unit tests for the regex-based document chunker."""
+
+import pytest
+
+from rag_system.text_splitter import RegexTextSplitter
+
+# Unique words make every chunk's position in the source text unambiguous
+SAMPLE_TEXT = "".join(
+    f"w{index}{separator}"
+    for index, separator in zip(range(400), ["  ", ". ", "\n", "\n\n", " "] * 80)
+)
+
+
+def _spans(text: str, chunks: list) -> list:
+    """Locate each chunk in text, scanning forward from the previous chunk."""
+    spans = []
+    position = 0
+    for chunk in chunks:
+        start = text.index(chunk, position)
+        spans.append((start, start + len(chunk)))
+        position = start + 1
+    return spans
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(40, 10), (25, 0), (100, 60)])
+def test_chunks_never_exceed_chunk_size(chunk_size, chunk_overlap) -> None:
+    """Every chunk fits within chunk_size characters."""
+    chunks = RegexTextSplitter(chunk_size, chunk_overlap).split_text(SAMPLE_TEXT)
+
+    assert chunks
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(40, 10), (25, 0), (100, 60)])
+def test_consecutive_chunks_overlap_by_at_most_chunk_overlap(chunk_size, chunk_overlap) -> None:
+    """Neighbouring chunks share no more than chunk_overlap characters."""
+    chunks = RegexTextSplitter(chunk_size, chunk_overlap).split_text(SAMPLE_TEXT)
+    spans = _spans(SAMPLE_TEXT, chunks)
+
+    for (_, previous_end), (next_start, _) in zip(spans, spans[1:]):
+        assert previous_end - next_start <= chunk_overlap
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(40, 10), (25, 0), (100, 60)])
+def test_chunks_cover_all_text(chunk_size, chunk_overlap) -> None:
+    """Every non-whitespace character lands in at least one chunk."""
+    chunks = RegexTextSplitter(chunk_size, chunk_overlap).split_text(SAMPLE_TEXT)
+    covered = set()
+    for start, end in _spans(SAMPLE_TEXT, chunks):
+        covered.update(range(start, end))
+
+    assert all(
+        index in covered for index, char in enumerate(SAMPLE_TEXT) if not char.isspace()
+    )
+
+
+def test_text_without_separators_is_cut_mid_word() -> None:
+    """A run longer than chunk_size is hard-cut and still overlaps."""
+    chunks = RegexTextSplitter(10, 3).split_text("a" * 25)
+
+    assert chunks == ["a" * 10, "a" * 10, "a" * 10, "a" * 4]
+
+
+def test_chunks_may_cross_paragraph_breaks() -> None:
+    """Separators are not ranked, so a chunk can span a paragraph break."""
+    chunks = RegexTextSplitter(20, 0).split_text("Alpha zeta.\n\nEta theta iota kappa")
+
+    assert chunks[0] == "Alpha zeta.\n\nEta"
+
+
+@pytest.mark.parametrize("text", ["", "   ", "\n\n \n"])
+def test_blank_text_yields_no_chunks(text) -> None:
+    """Empty or whitespace-only input produces no chunks."""
+    assert RegexTextSplitter(10, 2).split_text(text) == []
+
+
+def test_short_text_is_a_single_chunk() -> None:
+    """Text shorter than chunk_size comes back as one stripped chunk."""
+    assert RegexTextSplitter(50, 10).split_text("  Covenant A. \n") == ["Covenant A."]
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(10, 10), (10, -1)])
+def test_invalid_overlap_raises(chunk_size, chunk_overlap) -> None:
+    """chunk_overlap must be non-negative and smaller than chunk_size."""
+    with pytest.raises(ValueError):
+        RegexTextSplitter(chunk_size, chunk_overlap)
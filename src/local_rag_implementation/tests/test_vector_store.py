@@ -0,0 +1,87 @@
+"""Unit tests for the FAISS-backed VectorStore."""
+
+import faiss
+import numpy as np
+import pytest
+
+from rag_system.document import Document
+from rag_system.vector_store import HNSW_EF_SEARCH, VectorStore
+
+EMBEDDING_DIM = 384
+
+
+def _clustered_embeddings(count: int, seed: int = 0) -> np.ndarray:
+    """Build normalized vectors grouped around a few centres, like sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(20, EMBEDDING_DIM))
+    vectors = centres[rng.integers(0, 20, count)] + 0.3 * rng.normal(size=(count, EMBEDDING_DIM))
+    vectors = vectors.astype(np.float32)
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def _store_with(embeddings: np.ndarray) -> VectorStore:
+    store = VectorStore(embeddings.shape[1])
+    documents = [Document(content=str(index), metadata={}) for index in range(len(embeddings))]
+    store.add_documents(documents, embeddings.copy())
+    return store
+
+
+def test_search_recall_matches_exact_inner_product() -> None:
+    """Top-10 results agree with an exact IndexFlatIP search on at least 95% of hits."""
+    embeddings = _clustered_embeddings(2000)
+    store = _store_with(embeddings)
+    exact = faiss.IndexFlatIP(EMBEDDING_DIM)
+    exact.add(embeddings)
+    queries = embeddings[:100]
+
+    _, expected = exact.search(queries, 10)
+    hits = sum(
+        len({int(doc.content) for doc, _ in store.search(query, 10)} & set(truth))
+        for query, truth in zip(queries, expected)
+    )
+
+    assert hits / expected.size >= 0.95
+
+
+def test_search_returns_nearest_document_first() -> None:
+    """A stored vector used as the query comes back as the top hit with cosine ~1."""
+    embeddings = _clustered_embeddings(200)
+    store = _store_with(embeddings)
+
+    document, similarity = store.search(embeddings[42] * 3.0, 1)[0]
+
+    assert document.content == "42"
+    assert similarity == pytest.approx(1.0, abs=1e-3)
+
+
+def test_search_with_fewer_documents_than_k_skips_padding() -> None:
+    """HNSW pads missing neighbours with -1; those never become results."""
+    store = _store_with(_clustered_embeddings(3))
+
+    results = store.search(_clustered_embeddings(1, seed=1)[0], 10)
+
+    assert sorted(doc.content for doc, _ in results) == ["0", "1", "2"]
+
+
+def test_save_load_round_trip_restores_ef_search(tmp_path) -> None:
+    """efSearch is not persisted by FAISS, so load sets it again."""
+    embeddings = _clustered_embeddings(50)
+    store = _store_with(embeddings)
+    index_path, docs_path = str(tmp_path / "index.bin"), str(tmp_path / "docs.pkl")
+    store.save(index_path, docs_path)
+
+    loaded = VectorStore(EMBEDDING_DIM)
+    loaded.load(index_path, docs_path)
+
+    assert loaded.index.hnsw.efSearch == HNSW_EF_SEARCH
+    assert loaded.search(embeddings[7], 1)[0][0].content == "7"
+
+
+def test_load_rejects_pre_hnsw_index(tmp_path) -> None:
+    """Indexes saved before the HNSW switch ask the user to re-ingest."""
+    index_path = str(tmp_path / "index.bin")
+    faiss.write_index(faiss.IndexFlatL2(EMBEDDING_DIM), index_path)
+
+    with pytest.raises(ValueError, match="re-ingest"):
+        VectorStore(EMBEDDING_DIM).load(index_path, str(tmp_path / "docs.pkl"))